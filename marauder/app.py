@@ -1,6 +1,8 @@
 """Marauder TUI — Main application."""
 from __future__ import annotations
 
+import threading
+
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
@@ -12,6 +14,7 @@ from marauder.screens.dashboard import Dashboard
 from marauder.screens.attacks import AttacksPanel
 from marauder.screens.logs import LogsPanel
 from marauder.screens.serial_raw import SerialTerminal
+from marauder.widgets.activity_feed import ActivityFeed
 
 BANNER = r"""[green]
   ╔══════════════════════════════════════════════╗
@@ -105,8 +108,8 @@ class MarauderApp(App):
         super().__init__()
         self.bridge = SerialBridge()
         self.engine = MarauderEngine(self.bridge)
-        self._session_active = False
         self._thread_id: int = 0
+        self._last_status_key: tuple | None = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -123,18 +126,20 @@ class MarauderApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        import threading
         self._thread_id = threading.get_ident()
         self._dashboard = self.query_one("#dashboard", Dashboard)
         self._attacks = self.query_one("#attacks", AttacksPanel)
         self._logs = self.query_one("#logs", LogsPanel)
         self._serial = self.query_one("#serial-raw", SerialTerminal)
+        self._activity_feed = self._dashboard.query_one("#activity-feed", ActivityFeed)
 
         self._attacks.set_engine(self.engine)
         self._logs.set_engine(self.engine)
         self._serial.set_engine(self.engine)
 
         self.engine.on_state_change(self._on_engine_update)
+        # Raw serial lines are only pushed live while the Serial tab is shown
+        self.engine.set_raw_mirror(False)
         self._set_status(" [yellow]Connecting to ESP32...[/yellow]")
         self.run_worker(self._try_connect, thread=True)
 
@@ -152,39 +157,59 @@ class MarauderApp(App):
 
     def _on_connect_failed(self, error: str) -> None:
         self.engine.is_connected = False
+        self._last_status_key = None
         self._set_status(f"[red]No device found: {error}[/red]")
 
     def _on_engine_update(self, event_type: str, data: object) -> None:
-        """Called by engine on state changes (may be from serial or main thread)."""
-        import threading
-        if self._thread_id == threading.get_ident():
-            self._apply_update(event_type, data)
-        else:
+        """Called by engine on state changes.
+
+        Coalesced serial updates always arrive on the engine's consumer thread;
+        only user-triggered actions notify from the main thread.
+        """
+        if threading.get_ident() != self._thread_id:
             self.call_from_thread(self._apply_update, event_type, data)
+        else:
+            self._apply_update(event_type, data)
 
     def _apply_update(self, event_type: str, data: object) -> None:
-        """Apply engine update on the main thread."""
+        """Apply engine update on the main thread.
+
+        Serial events arrive batched: ``"activity"`` carries a list of
+        ``(category, message)`` tuples and ``"raw_line"`` a list of lines.
+        """
+        if event_type == "activity" and isinstance(data, list):
+            for category, message in data:
+                self._activity_feed.add_entry(category, message)
+            return
+
+        if event_type == "raw_line" and isinstance(data, list):
+            for line in data:
+                self._serial.add_line(str(line))
+            return
+
         self._dashboard.refresh_data(self.engine)
         self._update_status()
 
-        if event_type == "activity" and isinstance(data, tuple):
-            category, message = data
-            try:
-                feed = self._dashboard.query_one("#activity-feed")
-                feed.add_entry(category, message)
-            except Exception:
-                pass
-
-        if event_type == "raw_line":
-            self._serial.add_line(str(data))
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        self.engine.set_raw_mirror(event.pane.id == "tab-serial")
 
     def _update_status(self) -> None:
-        scan = self.engine.current_scan or "idle"
-        conn = "[green]● CONNECTED[/green]" if self.engine.is_connected else "[red]● DISCONNECTED[/red]"
-        port = self.bridge.port or "no port"
-        aps = len(self.engine.aps)
-        ble = len(self.engine.ble_devices)
-        session = " [yellow]● REC[/yellow]" if self._session_active else ""
+        key = (
+            self.engine.is_connected,
+            self.bridge.port,
+            self.engine.current_scan,
+            len(self.engine.aps),
+            len(self.engine.ble_devices),
+            self.engine.is_recording,
+        )
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+        connected, port, scan, aps, ble, recording = key
+        scan = scan or "idle"
+        conn = "[green]● CONNECTED[/green]" if connected else "[red]● DISCONNECTED[/red]"
+        port = port or "no port"
+        session = " [yellow]● REC[/yellow]" if recording else ""
         self._set_status(
             f" {conn}  {port}  │  scan: {scan}  │  APs: {aps}  BLE: {ble}{session}"
         )
@@ -210,16 +235,14 @@ class MarauderApp(App):
         tabs.active = "tab-attacks"
 
     def action_toggle_session(self) -> None:
-        if self._session_active:
+        if self.engine.is_recording:
             self.engine.stop_session()
-            self._session_active = False
         else:
             self.engine.start_session()
-            self._session_active = True
         self._update_status()
 
     def on_unmount(self) -> None:
-        if self._session_active:
+        if self.engine.is_recording:
             self.engine.stop_session()
         self.bridge.disconnect()
 
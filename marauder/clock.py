@@ -0,0 +1,26 @@
+"""Shared wall-clock timestamp for the log widgets.
+
+Every timestamped widget formats the same ``HH:MM:SS`` string, so the
+formatted value is cached here once per second for all of them.
+"""
+from __future__ import annotations
+
+import time
+
+# (epoch second, formatted local time) of the last call.
+_cache: tuple[int, str] = (-1, "")
+
+
+def hhmmss() -> str:
+    """Return the current local time as ``HH:MM:SS``.
+
+    The string is only re-formatted when the wall-clock second changes;
+    other calls cost a ``time.time()`` and a tuple lookup.
+    """
+    global _cache
+    now = time.time()
+    second = int(now)
+    cached = _cache
+    if cached[0] != second:
+        cached = _cache = (second, time.strftime("%H:%M:%S", time.localtime(now)))
+    return cached[1]
@@ -8,12 +8,23 @@ Marauder CLI commands.
 from __future__ import annotations
 
 import csv
+import heapq
 import io
 import json
+import logging
+import queue
+import threading
+import time
 from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, NamedTuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 from marauder.serial_bridge import (
     APFound,
@@ -26,12 +37,70 @@ from marauder.serial_bridge import (
     StationFound,
 )
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Defaults
 # ---------------------------------------------------------------------------
 
 _SESSIONS_DIR: Path = Path.home() / ".marauder-tui" / "sessions"
 _ACTIVITY_LOG_MAX: int = 200
+_RAW_BACKLOG_MAX: int = 2000
+_NOTIFY_INTERVAL: float = 0.05   # seconds to coalesce event notifications
+_RSSI_JITTER_DB: int = 3         # RSSI changes up to this size don't bump generations
+_SESSION_QUEUE_MAX: int = 4096
+_SESSION_BATCH_MAX: int = 64
+_SESSION_FLUSH_INTERVAL: float = 0.5
+_SESSION_STOP_TIMEOUT: float = 5.0
+_EVENT_QUEUE_MAX: int = 8192
+_EVENT_BATCH_MAX: int = 256
+_DROP_WARN_INTERVAL: float = 5.0
+
+# Queued to wake the consumer when a notification is marked from another thread.
+_WAKE = object()
+
+
+def _dumps_line(record: dict[str, Any]) -> bytes:
+    """Encode *record* as one UTF-8 JSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+_loads: Callable[[str], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def _by_rssi(event: Any) -> int:  # noqa: ANN401
+    return event.rssi
+
+
+# Activity-feed messages repeat heavily while a device keeps being re-seen,
+# so the formatted strings are memoised and shared.
+
+@lru_cache(maxsize=512)
+def _format_ap_msg(ssid: str, channel: int, rssi: int) -> str:
+    return f"Found AP: {ssid} ch{channel} {rssi}dBm"
+
+
+def _format_ap_label(idx: int, ap: APFound) -> str:
+    return f"[{idx}] {ap.ssid or '<hidden>'}  BSSID:{ap.bssid}  ch{ap.channel}  {ap.rssi}dBm"
+
+
+@lru_cache(maxsize=512)
+def _format_station_msg(mac: str, rssi: int, associated_bssid: str) -> str:
+    return f"Station: {mac} {rssi}dBm -> {associated_bssid}"
+
+
+@lru_cache(maxsize=512)
+def _format_ble_msg(name: str, rssi: int) -> str:
+    return f"Device: {name} {rssi}dBm"
+
+
+class LogEntry(NamedTuple):
+    """One activity-log line; *timestamp* is shared with the triggering event."""
+
+    timestamp: datetime
+    message: str
 
 
 class MarauderEngine:
@@ -49,24 +118,79 @@ class MarauderEngine:
         self.stations: list[StationFound] = []
         self.ble_devices: list[BLEDeviceFound] = []
 
+        # Pre-formatted AP target labels, parallel to ``aps``
+        self.ap_labels: list[str] = []
+
         # Indices for fast dedup lookups
         self._ap_index: dict[str, int] = {}        # bssid -> list index
         self._sta_index: dict[str, int] = {}        # mac   -> list index
         self._ble_index: dict[str, int] = {}        # mac   -> list index
 
+        # Generation counters, bumped when a table-visible change happens
+        self.ap_generation: int = 0
+        self.ble_generation: int = 0
+        # RSSI of each device at its last generation bump, so jitter is
+        # measured against what the tables last showed, not the last sighting
+        self._ap_bump_rssi: dict[str, int] = {}
+        self._ble_bump_rssi: dict[str, int] = {}
+
         # Activity log (human-readable feed)
-        self.activity_log: deque[tuple[datetime, str]] = deque(maxlen=_ACTIVITY_LOG_MAX)
+        self.activity_log: deque[LogEntry] = deque(maxlen=_ACTIVITY_LOG_MAX)
 
         # Scan state
         self.current_scan: str | None = None
         self.is_connected: bool = False
 
-        # Session recording
-        self._session_file: io.TextIOWrapper | None = None
+        # Session recording (encoded lines are written by a background thread,
+        # which owns and closes the file)
         self._session_path: Path | None = None
+        self._session_q: queue.Queue[bytes | None] | None = None
+        self._session_thread: threading.Thread | None = None
+        # Bumped whenever a session starts or stops; a session file can be
+        # appended to again (same-second names open with "ab")
+        self.session_generation: int = 0
 
         # Callbacks registered by the TUI
-        self._state_callbacks: list[Callable[[str, Any], None]] = []
+        # (immutable tuple, swapped on registration; the sole callback is
+        # also kept in ``_notify_fast`` for the common single-listener case)
+        self._state_callbacks: tuple[Callable[[str, Any], None], ...] = ()
+        self._notify_fast: Callable[[str, Any], None] | None = None
+
+        # Pending notifications, coalesced and flushed by the consumer thread
+        # once ``_flush_deadline`` (monotonic time) has passed
+        self._pending_lock: threading.Lock = threading.Lock()
+        self._dirty: set[str] = set()
+        self._pending_activity: list[tuple[str, str]] = []
+        self._pending_raw: list[str] = []
+        self._flush_deadline: float | None = None
+
+        # Raw lines are only fanned out while the TUI mirrors them live;
+        # otherwise they wait in a bounded backlog.
+        self._raw_mirror: bool = True
+        self._raw_backlog: deque[str] = deque(maxlen=_RAW_BACKLOG_MAX)
+
+        # Event type -> handler, looked up once per event
+        self._dispatch: dict[type, Callable[[Any, datetime], None]] = {
+            APFound: self._on_ap_found,
+            StationFound: self._on_station_found,
+            BLEDeviceFound: self._on_ble_device_found,
+            ScanStarted: self._on_scan_started,
+            ScanStopped: self._on_scan_stopped,
+            RawLine: self._on_raw_line,
+            Disconnected: self._on_disconnected,
+        }
+
+        # Bridge events are processed on a dedicated consumer thread so the
+        # serial reader never waits on dedup, logging or session recording
+        self._ev_q: queue.Queue[Any] = queue.Queue(maxsize=_EVENT_QUEUE_MAX)
+        self._dropped_events: int = 0
+        self._last_drop_warning: float = 0.0
+        self._consumer_thread = threading.Thread(
+            target=self._consume_loop,
+            name="marauder-engine-consumer",
+            daemon=True,
+        )
+        self._consumer_thread.start()
 
         # Register ourselves as the event handler for the bridge
         self._bridge.on_event(self._handle_event)
@@ -77,104 +201,256 @@ class MarauderEngine:
 
     def on_state_change(self, callback: Callable[[str, Any], None]) -> None:
         """Register a callback invoked on state changes. Receives (event_type, data)."""
-        self._state_callbacks.append(callback)
+        self._state_callbacks += (callback,)
+        self._notify_fast = callback if len(self._state_callbacks) == 1 else None
 
     def _notify(self, event_type: str = "update", data: Any = None) -> None:
         """Call every registered state-change callback with event info."""
+        fast = self._notify_fast
+        if fast is not None:
+            fast(event_type, data)
+            return
         for cb in self._state_callbacks:
             cb(event_type, data)
 
+    def _mark_dirty(self, event_type: str = "update", data: Any = None) -> None:
+        """Queue a notification and schedule a coalesced flush.
+
+        Serial events can arrive hundreds of times per second; rather than
+        fanning each one out to the TUI, they are batched and delivered
+        together by the consumer thread after ``_NOTIFY_INTERVAL`` seconds.
+        """
+        with self._pending_lock:
+            if event_type == "activity":
+                self._pending_activity.append(data)
+            elif event_type == "raw_line":
+                self._pending_raw.append(data)
+            self._dirty.add(event_type)
+            if self._flush_deadline is not None:
+                return
+            self._flush_deadline = time.monotonic() + _NOTIFY_INTERVAL
+        if threading.get_ident() != self._consumer_thread.ident:
+            # The consumer may be blocked without a deadline; wake it up.
+            # A full queue means it is busy and will see the deadline anyway.
+            try:
+                self._ev_q.put_nowait(_WAKE)
+            except queue.Full:
+                pass
+
+    def _flush(self) -> None:
+        """Deliver all pending notifications, one callback per category.
+
+        ``"activity"`` receives a list of ``(category, message)`` tuples and
+        ``"raw_line"`` a list of strings; a single ``"update"`` follows.
+        """
+        with self._pending_lock:
+            dirty, self._dirty = self._dirty, set()
+            activity, self._pending_activity = self._pending_activity, []
+            raw, self._pending_raw = self._pending_raw, []
+            self._flush_deadline = None
+        if activity:
+            self._deliver("activity", activity)
+        if raw:
+            self._deliver("raw_line", raw)
+        if "update" in dirty:
+            self._deliver("update")
+
+    def _deliver(self, event_type: str, data: Any = None) -> None:
+        """Notify the callbacks from the consumer thread, logging failures.
+
+        A raising callback (or one called after the app stopped) must not
+        kill the consumer, or every later event would queue up and drop.
+        """
+        try:
+            self._notify(event_type, data)
+        except Exception:
+            logger.exception("Exception in state callback for %r", event_type)
+
     # ------------------------------------------------------------------
     # Activity log helpers
     # ------------------------------------------------------------------
 
-    def _log(self, message: str) -> None:
+    def _log(self, message: str, now: datetime | None = None) -> None:
         """Append a timestamped message to the activity log."""
-        now = datetime.now()
-        self.activity_log.append((now, message))
+        if now is None:
+            now = datetime.now()
+        self.activity_log.append(LogEntry(now, message))
 
     # ------------------------------------------------------------------
-    # Event handling (called by the SerialBridge)
+    # Event handling (queued by the SerialBridge, processed by the consumer)
     # ------------------------------------------------------------------
 
     def _handle_event(self, event: Any) -> None:  # noqa: ANN401
-        """Dispatch an event emitted by the SerialBridge."""
-        if isinstance(event, APFound):
-            self._on_ap_found(event)
-        elif isinstance(event, StationFound):
-            self._on_station_found(event)
-        elif isinstance(event, BLEDeviceFound):
-            self._on_ble_device_found(event)
-        elif isinstance(event, ScanStarted):
-            self._on_scan_started(event)
-        elif isinstance(event, ScanStopped):
-            self._on_scan_stopped()
-        elif isinstance(event, RawLine):
-            self._on_raw_line(event)
-        elif isinstance(event, Disconnected):
-            self._on_disconnected()
+        """Queue an event emitted by the SerialBridge for the consumer thread.
 
-        # Session recording
-        self._record_event(event)
+        Never blocks the reader: if the queue is full the event is dropped
+        and counted, with a warning logged at most every few seconds.
+        """
+        try:
+            self._ev_q.put_nowait(event)
+        except queue.Full:
+            self._dropped_events += 1
+            now = time.monotonic()
+            if now - self._last_drop_warning >= _DROP_WARN_INTERVAL:
+                self._last_drop_warning = now
+                logger.warning(
+                    "Engine event queue full; %d events dropped so far",
+                    self._dropped_events,
+                )
+
+    def _consume_loop(self) -> None:
+        """Drain the event queue in batches and flush notifications on time.
+
+        Each batch marks an ``"update"``; pending notifications are flushed
+        once their deadline passes, whether or not events keep arriving.
+        """
+        while True:
+            deadline = self._flush_deadline
+            if deadline is None:
+                timeout = None
+            else:
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                event = self._ev_q.get(timeout=timeout)
+            except queue.Empty:
+                self._flush()
+                continue
+            count = 0
+            while True:
+                if event is not _WAKE:
+                    try:
+                        self._process_event(event)
+                    except Exception:
+                        logger.exception("Exception while processing %r", event)
+                    count += 1
+                    if count >= _EVENT_BATCH_MAX:
+                        break
+                try:
+                    event = self._ev_q.get_nowait()
+                except queue.Empty:
+                    break
+            if count:
+                # Notify the TUI (coalesced)
+                try:
+                    self._mark_dirty()
+                except Exception:
+                    logger.exception("Exception while scheduling notifications")
+            deadline = self._flush_deadline
+            if deadline is not None and time.monotonic() >= deadline:
+                self._flush()
+
+    def _process_event(self, event: Any) -> None:  # noqa: ANN401
+        """Apply a single bridge event to engine state and the session."""
+        now = datetime.now()
+        handler = self._dispatch.get(type(event))
+        if handler is not None:
+            handler(event, now)
 
-        # Notify the TUI
-        self._notify()
+        # Session recording
+        self._record_event(event, now)
 
     # -- individual event handlers --
 
-    def _on_ap_found(self, event: APFound) -> None:
-        bssid = event.bssid
-        if bssid in self._ap_index:
-            idx = self._ap_index[bssid]
-            self.aps[idx] = event
+    @staticmethod
+    def _upsert(items: list[Any], index: dict[str, int], key: str, event: Any) -> Any:  # noqa: ANN401
+        """Replace the entry for *key* in *items*, or append it if new.
+
+        *key* is used as given: the bridge already interns addresses, so
+        repeat lookups compare by identity.  Returns the previous entry, or
+        ``None`` if *key* was new.  An identical repeat sighting leaves the
+        stored instance in place.
+        """
+        idx = index.get(key)
+        if idx is None:
+            index[key] = len(items)
+            items.append(event)
+            return None
+        old = items[idx]
+        if old != event:
+            items[idx] = event
+        return old
+
+    def _on_ap_found(self, event: APFound, now: datetime) -> None:
+        old = self._upsert(self.aps, self._ap_index, event.bssid, event)
+        if old == event:
+            return
+        if (
+            old is None
+            or abs(self._ap_bump_rssi[event.bssid] - event.rssi) > _RSSI_JITTER_DB
+            or old.ssid != event.ssid
+            or old.channel != event.channel
+        ):
+            self.ap_generation += 1
+            self._ap_bump_rssi[event.bssid] = event.rssi
+        idx = self._ap_index[event.bssid]
+        label = _format_ap_label(idx, event)
+        if idx == len(self.ap_labels):
+            self.ap_labels.append(label)
         else:
-            self._ap_index[bssid] = len(self.aps)
-            self.aps.append(event)
-        msg = f"Found AP: {event.ssid} ch{event.channel} {event.rssi}dBm"
-        self._log(msg)
-        self._notify("activity", ("WiFi", msg))
+            self.ap_labels[idx] = label
+        msg = _format_ap_msg(event.ssid, event.channel, event.rssi)
+        self._log(msg, now)
+        self._mark_dirty("activity", ("WiFi", msg))
 
-    def _on_station_found(self, event: StationFound) -> None:
+    def _on_station_found(self, event: StationFound, now: datetime) -> None:
         mac = event.mac
-        if mac in self._sta_index:
-            idx = self._sta_index[mac]
-            self.stations[idx] = event
-        else:
-            self._sta_index[mac] = len(self.stations)
-            self.stations.append(event)
-        msg = f"Station: {mac} {event.rssi}dBm -> {event.associated_bssid}"
-        self._log(msg)
-        self._notify("activity", ("WiFi", msg))
+        if self._upsert(self.stations, self._sta_index, mac, event) == event:
+            return
+        msg = _format_station_msg(mac, event.rssi, event.associated_bssid)
+        self._log(msg, now)
+        self._mark_dirty("activity", ("WiFi", msg))
 
-    def _on_ble_device_found(self, event: BLEDeviceFound) -> None:
+    def _on_ble_device_found(self, event: BLEDeviceFound, now: datetime) -> None:
         mac = event.mac
-        if mac in self._ble_index:
-            idx = self._ble_index[mac]
-            self.ble_devices[idx] = event
-        else:
-            self._ble_index[mac] = len(self.ble_devices)
-            self.ble_devices.append(event)
-        name = event.name or mac
-        msg = f"Device: {name} {event.rssi}dBm"
-        self._log(msg)
-        self._notify("activity", ("BLE", msg))
-
-    def _on_scan_started(self, event: ScanStarted) -> None:
+        old = self._upsert(self.ble_devices, self._ble_index, mac, event)
+        if old == event:
+            return
+        if (
+            old is None
+            or abs(self._ble_bump_rssi[mac] - event.rssi) > _RSSI_JITTER_DB
+            or old.name != event.name
+        ):
+            self.ble_generation += 1
+            self._ble_bump_rssi[mac] = event.rssi
+        msg = _format_ble_msg(event.name or mac, event.rssi)
+        self._log(msg, now)
+        self._mark_dirty("activity", ("BLE", msg))
+
+    def _on_scan_started(self, event: ScanStarted, now: datetime) -> None:
         self.current_scan = event.scan_type
-        self._log(f"Scan started: {event.scan_type}")
+        self._log(f"Scan started: {event.scan_type}", now)
 
-    def _on_scan_stopped(self) -> None:
+    def _on_scan_stopped(self, _event: ScanStopped, now: datetime) -> None:
         prev = self.current_scan
         self.current_scan = None
-        self._log(f"Scan stopped (was: {prev})")
+        self._log(f"Scan stopped (was: {prev})", now)
+
+    def _on_raw_line(self, event: RawLine, _now: datetime) -> None:
+        with self._pending_lock:
+            if not self._raw_mirror:
+                self._raw_backlog.append(event.text)
+                return
+        self._mark_dirty("raw_line", event.text)
 
-    def _on_raw_line(self, event: RawLine) -> None:
-        self._notify("raw_line", event.text)
+    def set_raw_mirror(self, enabled: bool) -> None:
+        """Enable or pause live ``"raw_line"`` notifications.
 
-    def _on_disconnected(self) -> None:
+        While paused, raw lines are kept in a bounded backlog (they are
+        still recorded to the session).  Re-enabling delivers the backlog
+        in the next flush.
+        """
+        with self._pending_lock:
+            self._raw_mirror = enabled
+            if not enabled or not self._raw_backlog:
+                return
+            self._pending_raw.extend(self._raw_backlog)
+            self._raw_backlog.clear()
+        self._mark_dirty()
+
+    def _on_disconnected(self, _event: Disconnected, now: datetime) -> None:
         self.is_connected = False
         self.current_scan = None
-        self._log("Device disconnected")
+        self._log("Device disconnected", now)
 
     # ------------------------------------------------------------------
     # Scan commands
@@ -216,12 +492,30 @@ class MarauderEngine:
         self.aps.clear()
         self.stations.clear()
         self.ble_devices.clear()
+        self.ap_labels.clear()
         self._ap_index.clear()
         self._sta_index.clear()
         self._ble_index.clear()
+        self._ap_bump_rssi.clear()
+        self._ble_bump_rssi.clear()
+        self.ap_generation += 1
+        self.ble_generation += 1
         self._log("Results cleared")
         self._notify()
 
+    def top_aps(self, k: int) -> list[APFound]:
+        """Return the *k* strongest APs, strongest first.
+
+        The result is a fresh list, safe to keep while the serial thread
+        keeps mutating :attr:`aps`.  Compare :attr:`ap_generation` to skip
+        the call when nothing visible changed.
+        """
+        return heapq.nlargest(k, self.aps, key=_by_rssi)
+
+    def top_ble_devices(self, k: int) -> list[BLEDeviceFound]:
+        """Return the *k* strongest BLE devices, strongest first."""
+        return heapq.nlargest(k, self.ble_devices, key=_by_rssi)
+
     # ------------------------------------------------------------------
     # Attack commands
     # ------------------------------------------------------------------
@@ -279,46 +573,136 @@ class MarauderEngine:
     def start_session(self) -> Path:
         """Begin recording events to a JSONL file.
 
-        Returns the path of the new session file.
+        Returns the path of the new session file.  If a session is already
+        being recorded it keeps running and its path is returned instead.
         """
+        if self._session_path is not None:
+            return self._session_path
         _SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
         stamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         path = _SESSIONS_DIR / f"{stamp}.jsonl"
+        fh = open(path, "ab")  # noqa: SIM115
         self._session_path = path
-        self._session_file = open(path, "a", encoding="utf-8")  # noqa: SIM115
+        self._session_q = queue.Queue(maxsize=_SESSION_QUEUE_MAX)
+        self._session_thread = threading.Thread(
+            target=self._session_writer,
+            args=(fh, self._session_q),
+            name="marauder-session-writer",
+            daemon=True,
+        )
+        self._session_thread.start()
+        self.session_generation += 1
         self._log(f"Session recording started: {path.name}")
         self._notify()
         return path
 
     def stop_session(self) -> None:
-        """Stop recording and close the session file."""
-        if self._session_file is not None:
-            self._session_file.close()
-            self._session_file = None
-            name = self._session_path.name if self._session_path else "unknown"
-            self._session_path = None
-            self._log(f"Session recording stopped: {name}")
-            self._notify()
+        """Stop recording, drain pending events, and close the session file.
+
+        Waits at most ``_SESSION_STOP_TIMEOUT`` seconds for the writer; a
+        writer stuck on the file is abandoned (it is a daemon thread).
+        """
+        q, thread = self._session_q, self._session_thread
+        if q is None or thread is None:
+            return
+        # Stop queueing new records before handing the writer its sentinel
+        self._session_q = None
+        self._session_thread = None
+        name = self._session_path.name if self._session_path else "unknown"
+        self._session_path = None
+        self.session_generation += 1
+        if thread.is_alive():
+            try:
+                q.put(None, timeout=_SESSION_STOP_TIMEOUT)
+            except queue.Full:
+                logger.warning("Session writer is not draining; abandoning %s", name)
+            else:
+                thread.join(timeout=_SESSION_STOP_TIMEOUT)
+                if thread.is_alive():
+                    logger.warning("Session writer did not finish %s in time", name)
+        self._log(f"Session recording stopped: {name}")
+        self._notify()
+
+    @property
+    def session_path(self) -> Path | None:
+        """Path of the session file currently being recorded, if any."""
+        return self._session_path
 
     @property
     def is_recording(self) -> bool:
         """Whether a session is currently being recorded."""
-        return self._session_file is not None
+        return self._session_q is not None
+
+    def _record_event(self, event: Any, now: datetime) -> None:  # noqa: ANN401
+        """Queue an event as a JSON line for the session writer thread.
 
-    def _record_event(self, event: Any) -> None:  # noqa: ANN401
-        """Append an event as a JSON line to the active session file."""
-        if self._session_file is None:
+        Never blocks the caller: if the writer falls behind and the queue is
+        full, the event is dropped from the recording.
+        """
+        q = self._session_q
+        if q is None:
             return
         record: dict[str, Any] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "event_type": type(event).__name__,
         }
         # Serialise dataclass fields
         if hasattr(event, "__dataclass_fields__"):
             for field_name in event.__dataclass_fields__:
                 record[field_name] = getattr(event, field_name)
-        self._session_file.write(json.dumps(record) + "\n")
-        self._session_file.flush()
+        try:
+            q.put_nowait(_dumps_line(record))
+        except queue.Full:
+            pass
+
+    @staticmethod
+    def _session_writer(fh: io.BufferedWriter, q: queue.Queue[bytes | None]) -> None:
+        """Drain *q* into *fh* in batches, flushing at most every 500 ms.
+
+        Exits after writing everything queued before the ``None`` sentinel,
+        then closes *fh*.  After a write error (disk full, removed media)
+        the rest of the session is discarded, but the queue keeps being
+        drained so producers and :meth:`stop_session` never block on it.
+        """
+        last_flush = time.monotonic()
+        failed = False
+        done = False
+        try:
+            while not done:
+                try:
+                    item = q.get(timeout=_SESSION_FLUSH_INTERVAL)
+                except queue.Empty:
+                    item = b""
+                batch: list[bytes] = []
+                while True:
+                    if item is None:
+                        done = True
+                        break
+                    if item:
+                        batch.append(item)
+                    if len(batch) >= _SESSION_BATCH_MAX:
+                        break
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                if failed:
+                    continue
+                try:
+                    if batch:
+                        fh.writelines(batch)
+                    now = time.monotonic()
+                    if done or now - last_flush >= _SESSION_FLUSH_INTERVAL:
+                        fh.flush()
+                        last_flush = now
+                except OSError as exc:
+                    failed = True
+                    logger.error("Session write failed, recording discarded: %s", exc)
+        finally:
+            try:
+                fh.close()
+            except OSError as exc:
+                logger.error("Closing session file failed: %s", exc)
 
     # ------------------------------------------------------------------
     # Session management
@@ -331,39 +715,41 @@ class MarauderEngine:
         return sorted(_SESSIONS_DIR.glob("*.jsonl"), reverse=True)
 
     @staticmethod
-    def export_session_csv(session_path: Path) -> str:
-        """Convert a JSONL session file to CSV and return the CSV text.
+    def export_session_csv(session_path: Path, return_text: bool = False) -> str | None:
+        """Convert a JSONL session file to CSV next to it (``.csv`` extension).
 
-        The CSV is also written alongside the original file with a ``.csv``
-        extension.
+        Records are streamed straight to disk in two passes over the JSONL
+        file (one to collect column names, one to write rows), so memory use
+        does not grow with session length.  The CSV text is returned only
+        when *return_text* is true.
         """
-        rows: list[dict[str, Any]] = []
         fieldnames_set: set[str] = set()
-
-        with open(session_path, "r", encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                record: dict[str, Any] = json.loads(line)
-                rows.append(record)
-                fieldnames_set.update(record.keys())
+        for record in _iter_session_records(session_path):
+            fieldnames_set.update(record.keys())
 
         # Deterministic column order: timestamp first, then event_type, rest sorted
         priority = ["timestamp", "event_type"]
         fieldnames: list[str] = [f for f in priority if f in fieldnames_set]
         fieldnames += sorted(fieldnames_set - set(priority))
 
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
-
-        csv_text = output.getvalue()
-
         # Write CSV file next to the JSONL
         csv_path = session_path.with_suffix(".csv")
-        csv_path.write_text(csv_text, encoding="utf-8")
-
-        return csv_text
+        with open(csv_path, "w", encoding="utf-8", newline="") as out:
+            writer = csv.writer(out)
+            writer.writerow(fieldnames)
+            for record in _iter_session_records(session_path):
+                writer.writerow([record.get(f, "") for f in fieldnames])
+
+        if return_text:
+            return csv_path.read_text(encoding="utf-8")
+        return None
+
+
+def _iter_session_records(session_path: Path) -> Iterator[dict[str, Any]]:
+    """Yield each record of a JSONL session file, skipping blank lines."""
+    with open(session_path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            yield _loads(line)
@@ -7,6 +7,8 @@ designed to live inside a ``TabPane``, not as a standalone ``Screen``.
 
 from __future__ import annotations
 
+from typing import Callable
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widget import Widget
@@ -14,6 +16,62 @@ from textual.widgets import Button, Label, ListItem, ListView, Static
 
 from marauder.engine import MarauderEngine
 
+# Static compose markup, built once at import.
+_ATTACKS_HEADER: str = (
+    "[b]//////  ATTACK MODULES  //////[/b]\n"
+    "[#ff6666]WARNING: Use only on networks you own or have authorisation to test.[/]"
+)
+_WIFI_TITLE: str = "[#ff4444]>>> WiFi ATTACKS <<<[/]"
+_WIFI_SEPARATOR: str = "[#330000]" + "-" * 36 + "[/]"
+_BLE_TITLE: str = "[#aa00ff]>>> BLE SPAM <<<[/]"
+_BLE_SEPARATOR: str = "[#330033]" + "-" * 36 + "[/]"
+_ATTACKS_IDLE_STATUS: str = "[#ff4444]STATUS:[/] Idle  --  select an attack module"
+
+# (label, button id) pairs, in display order.
+_WIFI_BUTTONS: tuple[tuple[str, str], ...] = (
+    ("[ DEAUTH ATTACK ]", "btn-deauth"),
+    ("[ BEACON FLOOD ]", "btn-beacon"),
+    ("[ RICKROLL ]", "btn-rickroll"),
+    ("[ PROBE FLOOD ]", "btn-probe"),
+)
+_BLE_BUTTONS: tuple[tuple[str, str], ...] = (
+    ("[ Apple ]", "btn-ble-apple"),
+    ("[ Samsung ]", "btn-ble-samsung"),
+    ("[ Google ]", "btn-ble-google"),
+    ("[ Windows ]", "btn-ble-windows"),
+    ("[ Flipper ]", "btn-ble-flipper"),
+    ("[ ALL TARGETS ]", "btn-ble-all"),
+)
+
+# BLE spam button id -> ``MarauderEngine.ble_spam`` target.
+_BLE_TARGETS: dict[str, str] = {
+    "btn-ble-apple": "apple",
+    "btn-ble-samsung": "samsung",
+    "btn-ble-google": "google",
+    "btn-ble-windows": "windows",
+    "btn-ble-flipper": "flipper",
+    "btn-ble-all": "all",
+}
+
+# Pending action -> (confirm prompt, status message) templates.  ``{arg}``
+# is filled with the pending argument (the AP index for deauth).
+_ACTION_META: dict[str, tuple[str, str]] = {
+    "deauth": (
+        "[#ff4444]Execute DEAUTH attack on AP index {arg}?[/]",
+        "DEAUTH launched on AP index {arg}",
+    ),
+    "beacon_flood": ("[#ff4444]Launch BEACON FLOOD attack?[/]", "BEACON FLOOD launched"),
+    "rickroll": ("[#ff4444]Launch RICKROLL beacon attack?[/]", "RICKROLL launched"),
+    "probe": ("[#ff4444]Launch PROBE FLOOD attack?[/]", "PROBE FLOOD launched"),
+    **{
+        f"ble_spam_{target}": (
+            f"[#ff4444]Launch BLE SPAM attack (target: {target.upper()})?[/]",
+            f"BLE SPAM launched (target={target})",
+        )
+        for target in _BLE_TARGETS.values()
+    },
+}
+
 
 # ======================================================================
 # Confirmation overlay
@@ -79,6 +137,7 @@ class _ConfirmDialog(Widget):
     def __init__(self, message: str) -> None:
         super().__init__()
         self._message = message
+        self._msg: Static | None = None
 
     def compose(self) -> ComposeResult:
         yield Static(self._message, id="confirm-msg")
@@ -86,13 +145,26 @@ class _ConfirmDialog(Widget):
             yield Button("[EXECUTE]", id="btn-yes", variant="error", classes="confirm-btn")
             yield Button("[ABORT]", id="btn-no", variant="success", classes="confirm-btn")
 
+    def on_mount(self) -> None:
+        self._msg = self.query_one("#confirm-msg", Static)
+
+    def set_message(self, message: str) -> None:
+        """Replace the prompt text shown above the buttons."""
+        self._message = message
+        if self._msg is not None:
+            self._msg.update(message)
+
 
 # ======================================================================
 # AP selection overlay (for deauth)
 # ======================================================================
 
 class _APSelector(Widget):
-    """Overlay listing discovered APs for target selection."""
+    """Overlay listing discovered APs for target selection.
+
+    Takes the engine's pre-formatted ``ap_labels`` so composing the list
+    does no per-AP formatting on the UI thread.
+    """
 
     DEFAULT_CSS = """
     _APSelector {
@@ -141,19 +213,37 @@ class _APSelector(Widget):
     }
     """
 
-    def __init__(self, aps: list) -> None:
+    def __init__(self, labels: list[str]) -> None:
         super().__init__()
-        self._aps = aps
+        self._labels = labels
+        self._list: ListView | None = None
 
     def compose(self) -> ComposeResult:
         yield Static("[#ffaa00]> SELECT TARGET AP[/]", id="ap-title")
-        items: list[ListItem] = []
-        for idx, ap in enumerate(self._aps):
-            label = f"[{idx}] {ap.ssid or '<hidden>'}  BSSID:{ap.bssid}  ch{ap.channel}  {ap.rssi}dBm"
-            items.append(ListItem(Label(label), id=f"ap-item-{idx}"))
-        yield ListView(*items, id="ap-list")
+        yield ListView(*self._make_items(self._labels), id="ap-list")
         yield Button("[CANCEL]", id="ap-cancel")
 
+    def on_mount(self) -> None:
+        self._list = self.query_one("#ap-list", ListView)
+
+    @staticmethod
+    def _make_items(labels: list[str]) -> list[ListItem]:
+        # ``name`` rather than ``id``: a rebuild mounts the new items before
+        # the cleared ones are gone, so ids would collide.
+        return [
+            ListItem(Label(label), name=f"ap-item-{idx}")
+            for idx, label in enumerate(labels)
+        ]
+
+    def set_labels(self, labels: list[str]) -> None:
+        """Show *labels*, rebuilding the list only if they changed."""
+        if labels == self._labels or self._list is None:
+            return
+        self._labels = labels
+        with self.app.batch_update():
+            self._list.clear()
+            self._list.extend(self._make_items(labels))
+
 
 # ======================================================================
 # Main attacks panel
@@ -270,6 +360,10 @@ class AttacksPanel(Widget):
         self._engine: MarauderEngine | None = None
         self._pending_action: str | None = None
         self._pending_arg: int | None = None
+        self._active_overlay: Widget | None = None
+        self._status: Static | None = None
+        self._confirm_dialog: _ConfirmDialog | None = None
+        self._ap_selector: _APSelector | None = None
 
     # ------------------------------------------------------------------
     # Engine link
@@ -284,131 +378,82 @@ class AttacksPanel(Widget):
     # ------------------------------------------------------------------
 
     def compose(self) -> ComposeResult:
-        yield Static(
-            "[b]//////  ATTACK MODULES  //////[/b]\n"
-            "[#ff6666]WARNING: Use only on networks you own or have authorisation to test.[/]",
-            id="attacks-header",
-        )
+        yield Static(_ATTACKS_HEADER, id="attacks-header")
         with Horizontal(id="attacks-columns"):
             # ---- WiFi attacks ----
             with VerticalScroll(classes="attack-col"):
-                yield Static("[#ff4444]>>> WiFi ATTACKS <<<[/]", classes="col-title")
-                yield Static("[#330000]" + "-" * 36 + "[/]", classes="attack-separator")
-                yield Button(
-                    "[ DEAUTH ATTACK ]",
-                    id="btn-deauth",
-                    classes="wifi-attack-btn",
-                )
-                yield Button(
-                    "[ BEACON FLOOD ]",
-                    id="btn-beacon",
-                    classes="wifi-attack-btn",
-                )
-                yield Button(
-                    "[ RICKROLL ]",
-                    id="btn-rickroll",
-                    classes="wifi-attack-btn",
-                )
-                yield Button(
-                    "[ PROBE FLOOD ]",
-                    id="btn-probe",
-                    classes="wifi-attack-btn",
-                )
+                yield Static(_WIFI_TITLE, classes="col-title")
+                yield Static(_WIFI_SEPARATOR, classes="attack-separator")
+                for label, btn_id in _WIFI_BUTTONS:
+                    yield Button(label, id=btn_id, classes="wifi-attack-btn")
 
             # ---- BLE attacks ----
             with VerticalScroll(classes="attack-col"):
-                yield Static("[#aa00ff]>>> BLE SPAM <<<[/]", classes="col-title-ble")
-                yield Static("[#330033]" + "-" * 36 + "[/]", classes="attack-separator")
-                yield Button(
-                    "[ Apple ]",
-                    id="btn-ble-apple",
-                    classes="ble-attack-btn",
-                )
-                yield Button(
-                    "[ Samsung ]",
-                    id="btn-ble-samsung",
-                    classes="ble-attack-btn",
-                )
-                yield Button(
-                    "[ Google ]",
-                    id="btn-ble-google",
-                    classes="ble-attack-btn",
-                )
-                yield Button(
-                    "[ Windows ]",
-                    id="btn-ble-windows",
-                    classes="ble-attack-btn",
-                )
-                yield Button(
-                    "[ Flipper ]",
-                    id="btn-ble-flipper",
-                    classes="ble-attack-btn",
-                )
-                yield Button(
-                    "[ ALL TARGETS ]",
-                    id="btn-ble-all",
-                    classes="ble-attack-btn",
-                )
-
-        yield Static(
-            "[#ff4444]STATUS:[/] Idle  --  select an attack module",
-            id="attacks-status",
-        )
+                yield Static(_BLE_TITLE, classes="col-title-ble")
+                yield Static(_BLE_SEPARATOR, classes="attack-separator")
+                for label, btn_id in _BLE_BUTTONS:
+                    yield Button(label, id=btn_id, classes="ble-attack-btn")
+
+        yield Static(_ATTACKS_IDLE_STATUS, id="attacks-status")
+
+    # ------------------------------------------------------------------
+    # Post-mount wiring
+    # ------------------------------------------------------------------
+
+    def on_mount(self) -> None:
+        self._status = self.query_one("#attacks-status", Static)
+        # Both overlays are mounted once, hidden, and shown on demand.
+        self._confirm_dialog = _ConfirmDialog("")
+        self._confirm_dialog.display = False
+        self._ap_selector = _APSelector([])
+        self._ap_selector.display = False
+        self.mount(self._confirm_dialog, self._ap_selector)
 
     # ------------------------------------------------------------------
     # Button press dispatcher
     # ------------------------------------------------------------------
 
+    # -- Confirmation dialog responses --
+
+    def _confirm_yes(self) -> None:
+        self._execute_pending()
+        self._dismiss_overlay()
+
+    def _confirm_no(self) -> None:
+        self._pending_action = None
+        self._pending_arg = None
+        self._dismiss_overlay()
+        self._set_status("Aborted.")
+
+    def _cancel_ap_selection(self) -> None:
+        self._dismiss_overlay()
+        self._set_status("Target selection cancelled.")
+
+    # Button id -> handler, resolved once at class creation.
+    _DISPATCH: dict[str, Callable[[AttacksPanel], None]] = {
+        "btn-yes": _confirm_yes,
+        "btn-no": _confirm_no,
+        "ap-cancel": _cancel_ap_selection,
+        # -- WiFi attacks --
+        "btn-deauth": lambda self: self._show_ap_selector(),
+        "btn-beacon": lambda self: self._request_confirm("beacon_flood"),
+        "btn-rickroll": lambda self: self._request_confirm("rickroll"),
+        "btn-probe": lambda self: self._request_confirm("probe"),
+    }
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Route button presses to the appropriate action or dialog."""
         btn_id = event.button.id
 
-        # -- Confirmation dialog responses --
-        if btn_id == "btn-yes":
-            self._execute_pending()
-            self._dismiss_overlay()
-            return
-        if btn_id == "btn-no":
-            self._pending_action = None
-            self._pending_arg = None
-            self._dismiss_overlay()
-            self._set_status("Aborted.")
-            return
-        if btn_id == "ap-cancel":
-            self._dismiss_overlay()
-            self._set_status("Target selection cancelled.")
-            return
-
-        # -- WiFi attacks --
-        if btn_id == "btn-deauth":
-            self._show_ap_selector()
-            return
-        if btn_id == "btn-beacon":
-            self._request_confirm("beacon_flood", "Launch BEACON FLOOD attack?")
-            return
-        if btn_id == "btn-rickroll":
-            self._request_confirm("rickroll", "Launch RICKROLL beacon attack?")
-            return
-        if btn_id == "btn-probe":
-            self._request_confirm("probe", "Launch PROBE FLOOD attack?")
+        handler = self._DISPATCH.get(btn_id)
+        if handler is not None:
+            handler(self)
             return
 
         # -- BLE attacks --
-        ble_map: dict[str, str] = {
-            "btn-ble-apple": "apple",
-            "btn-ble-samsung": "samsung",
-            "btn-ble-google": "google",
-            "btn-ble-windows": "windows",
-            "btn-ble-flipper": "flipper",
-            "btn-ble-all": "all",
-        }
-        if btn_id in ble_map:
-            target = ble_map[btn_id]
-            self._request_confirm(
-                f"ble_spam_{target}",
-                f"Launch BLE SPAM attack (target: {target.upper()})?",
-            )
-            return
+        target = _BLE_TARGETS.get(btn_id)
+        if target is not None:
+            self._request_confirm("ble_spam_" + target)
 
     # ------------------------------------------------------------------
     # ListView selection (AP selector)
@@ -416,27 +461,25 @@ class AttacksPanel(Widget):
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle AP selection from the target list."""
-        item_id: str | None = event.item.id
+        item_id: str | None = event.item.name
         if item_id and item_id.startswith("ap-item-"):
             idx = int(item_id.removeprefix("ap-item-"))
             self._dismiss_overlay()
-            self._request_confirm(
-                "deauth",
-                f"Execute DEAUTH attack on AP index {idx}?",
-                arg=idx,
-            )
+            self._request_confirm("deauth", arg=idx)
 
     # ------------------------------------------------------------------
     # Dialog helpers
     # ------------------------------------------------------------------
 
-    def _request_confirm(self, action: str, message: str, *, arg: int | None = None) -> None:
-        """Show a confirmation dialog for *action*."""
+    def _request_confirm(self, action: str, *, arg: int | None = None) -> None:
+        """Show the confirmation prompt from ``_ACTION_META`` for *action*."""
         self._pending_action = action
         self._pending_arg = arg
-        self._dismiss_overlay()
-        dialog = _ConfirmDialog(f"[#ff4444]{message}[/]")
-        self.mount(dialog)
+        dialog = self._confirm_dialog
+        if dialog is None:
+            return
+        dialog.set_message(_ACTION_META[action][0].format(arg=arg))
+        self._show_overlay(dialog)
 
     def _show_ap_selector(self) -> None:
         """Show the AP target selection overlay."""
@@ -446,16 +489,27 @@ class AttacksPanel(Widget):
         if not self._engine.aps:
             self._set_status("No APs discovered. Run a WiFi scan first.")
             return
+        selector = self._ap_selector
+        if selector is None:
+            return
+        selector.set_labels(list(self._engine.ap_labels))
+        self._show_overlay(selector)
+
+    def _show_overlay(self, overlay: Widget) -> None:
+        """Hide the active overlay, if any, and reveal *overlay* in its place."""
+        if overlay is self._active_overlay:
+            return
         self._dismiss_overlay()
-        selector = _APSelector(self._engine.aps)
-        self.mount(selector)
+        self._active_overlay = overlay
+        overlay.display = True
 
     def _dismiss_overlay(self) -> None:
-        """Remove any mounted overlay dialogs."""
-        for overlay in self.query(_ConfirmDialog):
-            overlay.remove()
-        for overlay in self.query(_APSelector):
-            overlay.remove()
+        """Hide the active overlay dialog, if any."""
+        overlay = self._active_overlay
+        if overlay is None:
+            return
+        self._active_overlay = None
+        overlay.display = False
 
     def _execute_pending(self) -> None:
         """Execute the pending attack action via the engine."""
@@ -467,30 +521,23 @@ class AttacksPanel(Widget):
         self._pending_action = None
         self._pending_arg = None
 
-        if action == "deauth" and arg is not None:
+        meta = _ACTION_META.get(action) if action else None
+        if meta is None or (action == "deauth" and arg is None):
+            self._set_status(f"Unknown action: {action}")
+            return
+
+        if action == "deauth":
             self._engine.attack_deauth(arg)
-            self._set_status(f"DEAUTH launched on AP index {arg}")
-        elif action == "beacon_flood":
+        elif action in ("beacon_flood", "probe"):
+            # Probe uses the beacon flood mechanism with probe frames
             self._engine.attack_beacon_flood()
-            self._set_status("BEACON FLOOD launched")
         elif action == "rickroll":
             self._engine.attack_rickroll()
-            self._set_status("RICKROLL launched")
-        elif action == "probe":
-            # Probe uses the beacon flood mechanism with probe frames
-            self._engine.attack_beacon_flood()
-            self._set_status("PROBE FLOOD launched")
-        elif action and action.startswith("ble_spam_"):
-            target = action.removeprefix("ble_spam_")
-            self._engine.ble_spam(target)
-            self._set_status(f"BLE SPAM launched (target={target})")
         else:
-            self._set_status(f"Unknown action: {action}")
+            self._engine.ble_spam(action.removeprefix("ble_spam_"))
+        self._set_status(meta[1].format(arg=arg))
 
     def _set_status(self, message: str) -> None:
         """Update the bottom status bar."""
-        try:
-            bar = self.query_one("#attacks-status", Static)
-            bar.update(f"[#ff4444]STATUS:[/] {message}")
-        except Exception:
-            pass
+        if self._status is not None:
+            self._status.update(f"[#ff4444]STATUS:[/] {message}")
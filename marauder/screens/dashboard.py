@@ -17,6 +17,9 @@ from marauder.engine import MarauderEngine
 from marauder.widgets.activity_feed import ActivityFeed
 from marauder.widgets.device_table import BLETable, WiFiTable
 
+# Maximum rows rendered per device table (strongest signals are kept).
+_TABLE_MAX_ROWS: int = 100
+
 
 class _SectionHeader(Static):
     """Tiny styled header label for a panel section."""
@@ -116,6 +119,11 @@ class Dashboard(Widget):
         self._ble_table: BLETable | None = None
         self._activity_feed: ActivityFeed | None = None
         self._status_bar: Static | None = None
+        self._ap_generation: int = -1
+        self._ble_generation: int = -1
+        self._shown_aps: list = []
+        self._shown_ble: list = []
+        self._last_status_key: tuple | None = None
 
     # ------------------------------------------------------------------
     # Compose
@@ -153,25 +161,49 @@ class Dashboard(Widget):
     # ------------------------------------------------------------------
 
     def refresh_data(self, engine: MarauderEngine) -> None:
-        """Pull the latest data from *engine* and update all child widgets."""
-        if self._wifi_table is not None:
-            self._wifi_table.update_devices(engine.aps)
-
-        if self._ble_table is not None:
-            self._ble_table.update_devices(engine.ble_devices)
-
-        # Status bar
-        if self._status_bar is not None:
-            conn = "[#00ff00]ONLINE[/]" if engine.is_connected else "[#ff0000]OFFLINE[/]"
-            scan = engine.current_scan or "idle"
-            aps = len(engine.aps)
-            ble = len(engine.ble_devices)
-            sta = len(engine.stations)
-            self._status_bar.update(
-                f"[b][ MARAUDER ][/b]  "
-                f"Link: {conn}  |  "
-                f"Scan: [#00ff00]{scan}[/]  |  "
-                f"APs: [#00ff00]{aps}[/]  "
-                f"STAs: [#00ff00]{sta}[/]  "
-                f"BLE: [#00ff00]{ble}[/]"
-            )
+        """Pull the latest data from *engine* into all child widgets.
+
+        Not debounced here: the engine already coalesces serial updates
+        into one ``"update"`` per 50 ms window.  Tables are only rebuilt
+        when the engine's generation counter for that table has moved
+        since the last refresh *and* the rows to show differ from those
+        already rendered.
+        """
+        if self._wifi_table is not None and engine.ap_generation != self._ap_generation:
+            self._ap_generation = engine.ap_generation
+            aps = engine.top_aps(_TABLE_MAX_ROWS)
+            if aps != self._shown_aps:
+                self._shown_aps = aps
+                self._wifi_table.update_devices(aps)
+
+        if self._ble_table is not None and engine.ble_generation != self._ble_generation:
+            self._ble_generation = engine.ble_generation
+            devices = engine.top_ble_devices(_TABLE_MAX_ROWS)
+            if devices != self._shown_ble:
+                self._shown_ble = devices
+                self._ble_table.update_devices(devices)
+
+        # Status bar (only re-rendered when one of its values changed)
+        if self._status_bar is None:
+            return
+        key = (
+            engine.is_connected,
+            engine.current_scan,
+            len(engine.aps),
+            len(engine.ble_devices),
+            len(engine.stations),
+        )
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+        connected, scan, aps, ble, sta = key
+        conn = "[#00ff00]ONLINE[/]" if connected else "[#ff0000]OFFLINE[/]"
+        scan = scan or "idle"
+        self._status_bar.update(
+            f"[b][ MARAUDER ][/b]  "
+            f"Link: {conn}  |  "
+            f"Scan: [#00ff00]{scan}[/]  |  "
+            f"APs: [#00ff00]{aps}[/]  "
+            f"STAs: [#00ff00]{sta}[/]  "
+            f"BLE: [#00ff00]{ble}[/]"
+        )
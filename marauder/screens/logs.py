@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widget import Widget
@@ -15,6 +16,18 @@ from textual.widgets import Button, Label, ListItem, ListView, Static
 
 from marauder.engine import MarauderEngine
 
+# Static compose markup, built once at import.
+_LOGS_HEADER: str = (
+    "[b]//////  SESSION LOGGER  //////[/b]\n"
+    "[#00cc00]Record, review, and export session data.[/]"
+)
+_REC_STOPPED: str = "[#666666]REC: STOPPED[/]"
+_SESSIONS_TITLE: str = "[#00ff00]> Saved Sessions[/]"
+_NO_SESSIONS: Text = Text.from_markup("[#666666]-- no sessions found --[/]")
+
+# Sessions rendered per page in the list; more load on demand.
+_SESSION_PAGE_SIZE: int = 50
+
 
 class LogsPanel(Widget):
     """Session recording and history panel.
@@ -187,37 +200,39 @@ class LogsPanel(Widget):
         self._engine: MarauderEngine | None = None
         self._sessions: list[Path] = []
         self._selected_index: int | None = None
+        # Sizes of finished sessions, valid while the engine's
+        # session_generation stays at _sizes_generation
+        self._session_sizes: dict[Path, int] = {}
+        self._sizes_generation: int = -1
+        self._rendered_upto: int = 0
+        self._sessions_list: ListView | None = None
+        self._rec_status: Static | None = None
+        self._export_status: Static | None = None
 
     # ------------------------------------------------------------------
     # Engine link
     # ------------------------------------------------------------------
 
     def set_engine(self, engine: MarauderEngine) -> None:
-        """Bind the panel to *engine*."""
+        """Bind the panel to *engine* and populate the session list."""
         self._engine = engine
+        self.refresh_sessions()
 
     # ------------------------------------------------------------------
     # Compose
     # ------------------------------------------------------------------
 
     def compose(self) -> ComposeResult:
-        yield Static(
-            "[b]//////  SESSION LOGGER  //////[/b]\n"
-            "[#00cc00]Record, review, and export session data.[/]",
-            id="logs-header",
-        )
+        yield Static(_LOGS_HEADER, id="logs-header")
 
         with Vertical(id="rec-controls"):
             with Horizontal(id="rec-controls-row"):
                 yield Button("[ REC START ]", id="btn-rec-start")
                 yield Button("[ REC STOP ]", id="btn-rec-stop")
-                yield Static(
-                    "[#666666]REC: STOPPED[/]",
-                    id="rec-status",
-                )
+                yield Static(_REC_STOPPED, id="rec-status")
 
         with VerticalScroll(id="sessions-section"):
-            yield Static("[#00ff00]> Saved Sessions[/]", id="sessions-title")
+            yield Static(_SESSIONS_TITLE, id="sessions-title")
             yield ListView(id="sessions-list")
 
         with Horizontal(id="export-bar"):
@@ -230,33 +245,85 @@ class LogsPanel(Widget):
     # ------------------------------------------------------------------
 
     def refresh_sessions(self) -> None:
-        """Reload the session file listing from engine."""
+        """Reload the session file listing from engine.
+
+        Only the first page of sessions is rendered; further pages are
+        appended when the trailing "more" item is highlighted.
+        """
         if self._engine is None:
             return
         self._sessions = self._engine.list_sessions()
         self._selected_index = None
-        try:
-            lv = self.query_one("#sessions-list", ListView)
+        self._rendered_upto = 0
+        listed = set(self._sessions)
+        self._session_sizes = {
+            path: size for path, size in self._session_sizes.items() if path in listed
+        }
+        lv = self._sessions_list
+        if lv is None:
+            return
+        if not self._sessions:
+            items = [ListItem(Label(_NO_SESSIONS))]
+        else:
+            items = self._next_session_page()
+        with self.app.batch_update():
             lv.clear()
-            if not self._sessions:
-                lv.append(ListItem(Label("[#666666]-- no sessions found --[/]")))
-            else:
-                for idx, path in enumerate(self._sessions):
-                    stat = path.stat()
-                    size_kb = stat.st_size / 1024
-                    name = path.name
-                    info = f"[{idx}] {name}  ({size_kb:.1f} KB)"
-                    lv.append(ListItem(Label(info), id=f"sess-{idx}"))
-        except Exception:
-            pass
+            lv.extend(items)
+
+    def _next_session_page(self) -> list[ListItem]:
+        """Build list items for the next page of sessions, plus a "more" marker."""
+        start = self._rendered_upto
+        stop = min(start + _SESSION_PAGE_SIZE, len(self._sessions))
+        active: Path | None = None
+        if self._engine is not None:
+            active = self._engine.session_path
+            if self._engine.session_generation != self._sizes_generation:
+                # A session started or stopped: its file may have grown
+                self._session_sizes.clear()
+                self._sizes_generation = self._engine.session_generation
+        items: list[ListItem] = []
+        for idx in range(start, stop):
+            path = self._sessions[idx]
+            size = self._session_sizes.get(path)
+            if size is None or path == active:
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    size = 0
+                if path != active:
+                    self._session_sizes[path] = size
+            size_kb = size / 1024
+            name = path.name
+            info = f"[{idx}] {name}  ({size_kb:.1f} KB)"
+            # ``name`` rather than ``id``: a refresh mounts the new items
+            # before the cleared ones are gone, so ids would collide.
+            items.append(ListItem(Label(info, markup=False), name=f"sess-{idx}"))
+        self._rendered_upto = stop
+        if stop < len(self._sessions):
+            more = f"[#666666]-- {len(self._sessions) - stop} more --[/]"
+            items.append(ListItem(Label(more), name="sess-more"))
+        return items
+
+    def _load_more_sessions(self, marker: ListItem) -> None:
+        """Replace the "more" marker with the next page of sessions."""
+        lv = self._sessions_list
+        if lv is None:
+            return
+        items = self._next_session_page()
+        with self.app.batch_update():
+            marker.remove()
+            lv.extend(items)
 
     # ------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------
 
     def on_mount(self) -> None:
-        # Populate the list once mounted (engine may not be set yet).
-        self.call_later(self.refresh_sessions)
+        self._sessions_list = self.query_one("#sessions-list", ListView)
+        self._rec_status = self.query_one("#rec-status", Static)
+        self._export_status = self.query_one("#export-status", Static)
+        # Populate the list after first paint; a no-op until the engine is set.
+        self.call_after_refresh(self.refresh_sessions)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         btn_id = event.button.id
@@ -270,11 +337,18 @@ class LogsPanel(Widget):
         elif btn_id == "btn-refresh-list":
             self.refresh_sessions()
 
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        if event.item is not None and event.item.name == "sess-more":
+            self._load_more_sessions(event.item)
+
     def on_list_view_selected(self, event: ListView.Selected) -> None:
-        item_id: str | None = event.item.id
-        if item_id and item_id.startswith("sess-"):
-            self._selected_index = int(item_id.removeprefix("sess-"))
-            path = self._sessions[self._selected_index]
+        item_name: str | None = event.item.name
+        if item_name and item_name.startswith("sess-") and item_name != "sess-more":
+            idx = int(item_name.removeprefix("sess-"))
+            if idx == self._selected_index:
+                return
+            self._selected_index = idx
+            path = self._sessions[idx]
             self._set_export_status(f"Selected: {path.name}")
 
     # ------------------------------------------------------------------
@@ -295,10 +369,10 @@ class LogsPanel(Widget):
         if self._engine is None:
             return
         if not self._engine.is_recording:
-            self._set_rec_status("[#666666]REC: STOPPED[/]")
+            self._set_rec_status(_REC_STOPPED)
             return
         self._engine.stop_session()
-        self._set_rec_status("[#666666]REC: STOPPED[/]")
+        self._set_rec_status(_REC_STOPPED)
         self.refresh_sessions()
 
     # ------------------------------------------------------------------
@@ -310,25 +384,35 @@ class LogsPanel(Widget):
             self._set_export_status("[#ffaa00]Select a session first.[/]")
             return
         path = self._sessions[self._selected_index]
+        self._set_export_status(f"[#00cc00]Exporting {path.name}...[/]")
+        self.run_worker(
+            lambda: self._export_csv(path),
+            group="export",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _export_csv(self, path: Path) -> None:
+        """Export *path* to CSV (runs in worker thread)."""
         try:
             MarauderEngine.export_session_csv(path)
             csv_path = path.with_suffix(".csv")
-            self._set_export_status(f"[#00ff00]Exported: {csv_path.name}[/]")
+            self.app.call_from_thread(
+                self._set_export_status, f"[#00ff00]Exported: {csv_path.name}[/]"
+            )
         except Exception as exc:
-            self._set_export_status(f"[#ff4444]Export error: {exc}[/]")
+            self.app.call_from_thread(
+                self._set_export_status, f"[#ff4444]Export error: {exc}[/]"
+            )
 
     # ------------------------------------------------------------------
     # UI helpers
     # ------------------------------------------------------------------
 
     def _set_rec_status(self, text: str) -> None:
-        try:
-            self.query_one("#rec-status", Static).update(text)
-        except Exception:
-            pass
+        if self._rec_status is not None:
+            self._rec_status.update(text)
 
     def _set_export_status(self, text: str) -> None:
-        try:
-            self.query_one("#export-status", Static).update(text)
-        except Exception:
-            pass
+        if self._export_status is not None:
+            self._export_status.update(text)
@@ -7,15 +7,26 @@ use inside a ``TabPane``.
 
 from __future__ import annotations
 
-from datetime import datetime
-
+from rich.markup import escape
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Button, Input, RichLog, Static
 
+from marauder.clock import hhmmss
 from marauder.engine import MarauderEngine
 
+# Seconds to collect incoming lines before writing them to the log.
+_FLUSH_INTERVAL: float = 0.033
+
+# Markup around the timestamp and text of received (RX) and echoed (TX)
+# lines, joined with the per-line values instead of re-built per line.
+_TS_PREFIX: str = "[#006600]"
+_RX_MID: str = "[/] [#00ff00]"
+_TX_MID: str = "[/] [#ffaa00][b]TX >>>[/b] "
+_LINE_SUFFIX: str = "[/]"
+
 
 class SerialTerminal(Widget):
     """Raw serial monitor with manual command entry.
@@ -121,6 +132,9 @@ class SerialTerminal(Widget):
         super().__init__(name=name, id=id, classes=classes)
         self._engine: MarauderEngine | None = None
         self._log: RichLog | None = None
+        self._input: Input | None = None
+        self._pending: list[str] = []
+        self._flush_timer: Timer | None = None
 
     # ------------------------------------------------------------------
     # Engine link
@@ -161,6 +175,7 @@ class SerialTerminal(Widget):
 
     def on_mount(self) -> None:
         self._log = self.query_one("#serial-log", RichLog)
+        self._input = self.query_one("#serial-input", Input)
         # Write a boot banner
         self._log.write(
             "[#004400]========================================"
@@ -183,11 +198,15 @@ class SerialTerminal(Widget):
     # ------------------------------------------------------------------
 
     def add_line(self, text: str) -> None:
-        """Append a raw serial line to the terminal log."""
+        """Append a raw serial line to the terminal log.
+
+        Lines are buffered and written to the log together, at most once
+        every 33 ms.
+        """
         if self._log is None:
             return
-        ts = datetime.now().strftime("%H:%M:%S")
-        self._log.write(f"[#006600]{ts}[/] [#00ff00]{text}[/]")
+        ts = hhmmss()
+        self._queue_write("".join((_TS_PREFIX, ts, _RX_MID, escape(text), _LINE_SUFFIX)))
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -211,20 +230,19 @@ class SerialTerminal(Widget):
 
     def _send_command(self) -> None:
         """Read the input field, send the command via engine bridge, and echo it."""
-        try:
-            input_widget = self.query_one("#serial-input", Input)
-        except Exception:
+        input_widget = self._input
+        if input_widget is None:
             return
 
         cmd = input_widget.value.strip()
         if not cmd:
             return
 
-        # Echo the command locally
-        ts = datetime.now().strftime("%H:%M:%S")
+        # Echo the command locally (queued so it stays after earlier lines)
+        ts = hhmmss()
         if self._log is not None:
-            self._log.write(
-                f"[#006600]{ts}[/] [#ffaa00][b]TX >>>[/b] {cmd}[/]"
+            self._queue_write(
+                "".join((_TS_PREFIX, ts, _TX_MID, escape(cmd), _LINE_SUFFIX))
             )
 
         # Send via engine bridge
@@ -233,15 +251,44 @@ class SerialTerminal(Widget):
                 self._engine._bridge.send_command(cmd)
             except Exception as exc:
                 if self._log is not None:
-                    self._log.write(
-                        f"[#ff4444][b]ERROR:[/b] {exc}[/]"
+                    self._queue_write(
+                        f"[#ff4444][b]ERROR:[/b] {escape(str(exc))}[/]"
                     )
 
         # Clear the input field
         input_widget.value = ""
         input_widget.focus()
 
+        # User action: show the echo now rather than on the next tick
+        self._flush_now()
+
     def _clear_log(self) -> None:
         """Clear all lines from the serial log."""
+        self._pending.clear()
+        self._stop_flush_timer()
         if self._log is not None:
             self._log.clear()
+
+    def _queue_write(self, markup: str) -> None:
+        """Buffer one markup line and arm the flush timer if it is idle."""
+        self._pending.append(markup)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(_FLUSH_INTERVAL, self._flush_pending)
+
+    def _stop_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+
+    def _flush_now(self) -> None:
+        """Write pending lines immediately instead of waiting for the timer."""
+        self._stop_flush_timer()
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write all buffered lines to the log as a single entry."""
+        self._flush_timer = None
+        if not self._pending or self._log is None:
+            return
+        self._log.write("\n".join(self._pending))
+        self._pending.clear()
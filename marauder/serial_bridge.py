@@ -8,14 +8,16 @@ from __future__ import annotations
 
 import glob
 import logging
+import queue
 import re
+import sys
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from typing import Callable, Union
 
 import serial
+from serial.tools import list_ports
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +25,11 @@ logger = logging.getLogger(__name__)
 # Event dataclasses
 # ---------------------------------------------------------------------------
 
+# ``slots=True`` needs Python 3.10+; on 3.9 the events keep a ``__dict__``.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class APFound:
     """Access point discovered during ``scanap``."""
 
@@ -34,7 +39,7 @@ class APFound:
     rssi: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class StationFound:
     """Station discovered during ``scansta``."""
 
@@ -43,7 +48,7 @@ class StationFound:
     associated_bssid: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class BLEDeviceFound:
     """Bluetooth LE device discovered during ``sniffbt``."""
 
@@ -52,26 +57,26 @@ class BLEDeviceFound:
     rssi: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ScanStarted:
     """Emitted when a scan command is acknowledged by the device."""
 
     scan_type: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ScanStopped:
     """Emitted when a scan is stopped (either by command or device)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Disconnected:
     """Emitted when the serial connection is lost."""
 
     reason: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class RawLine:
     """Catch-all for any line that does not match a known pattern."""
 
@@ -92,39 +97,124 @@ Event = Union[
 # Regex patterns for Marauder output
 # ---------------------------------------------------------------------------
 
-# AP scan line:  -58 Ch: 2 BSSID: 1c:3b:f3:7e:9e:94 ESSID: wifi_casa
-_RE_AP = re.compile(
-    r"^(-?\d+)\s+Ch:\s*(\d+)\s+BSSID:\s*"
-    r"([0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5})\s+ESSID:\s*(.*?)\s*$"
+_MAC = r"[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}"
+
+# Whole-line patterns, matched by a single ``fullmatch`` on the stripped
+# line (so no trailing ``\s*$`` is needed).  The alternatives are mutually
+# exclusive, so their order only affects speed.  The outer group name
+# (``m.lastgroup``) selects the event builder below.
+_LINE_PATTERNS: dict[str, str] = {
+    # AP scan line:  -58 Ch: 2 BSSID: 1c:3b:f3:7e:9e:94 ESSID: wifi_casa
+    "ap": (
+        r"(?P<ap_rssi>-?\d+)\s+Ch:\s*(?P<ap_ch>\d+)\s+BSSID:\s*"
+        rf"(?P<ap_bssid>{_MAC})\s+ESSID:\s*(?P<ap_ssid>.*)"
+    ),
+    # Station scan line:  -55 Station: AA:BB:CC:DD:EE:FF Associated: 11:22:33:44:55:66
+    "sta": (
+        r"(?P<sta_rssi>-?\d+)\s+Station:\s*"
+        rf"(?P<sta_mac>{_MAC})\s+Associated:\s*(?P<sta_bssid>{_MAC})"
+    ),
+    # BLE device with name:  -80 Device: [LG] webOS TV UP7550PSF
+    "ble_named": (
+        r"(?P<bn_rssi>-?\d+)\s+Device:\s*"
+        r"\[\s*(?P<bn_brand>.+?)\s*\]\s*(?P<bn_model>.*)"
+    ),
+    # BLE device without name:  -73 Device: 63:C6:BB:7B:D1:1C
+    "ble_mac": rf"(?P<bm_rssi>-?\d+)\s+Device:\s*(?P<bm_mac>{_MAC})",
+}
+
+
+def _compile_line_re(*order: str) -> re.Pattern[str]:
+    """Join the ``_LINE_PATTERNS`` named in *order* into one alternation."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{_LINE_PATTERNS[name]})" for name in order), re.ASCII
+    )
+
+
+_RE_LINE = _compile_line_re("ap", "sta", "ble_named", "ble_mac")
+
+# ``ScanStarted.scan_type`` -> ``_RE_LINE`` variant that tries the lines
+# that scan produces first.
+_RE_LINE_BY_SCAN: dict[str, re.Pattern[str]] = {
+    "ap": _RE_LINE,
+    "station": _compile_line_re("sta", "ap", "ble_named", "ble_mac"),
+    "bluetooth": _compile_line_re("ble_mac", "ble_named", "ap", "sta"),
+}
+
+# Cheap gates checked before entering the regex engine: every ``_RE_LINE``
+# alternative starts with an RSSI, and every scan-state indicator contains
+# "scan", "shutting" or "stopping" in lower case (tested inline in
+# ``_handle_line``, where a plain ``or`` chain beats looping over a tuple).
+_RSSI_START_CHARS: frozenset[str] = frozenset("-0123456789")
+
+# Scan started / stopped indicators, found anywhere in the lower-cased line
+# by a single search (lower-case literals instead of ``re.IGNORECASE``).
+# The group name keys the (immutable, shared) event to emit.
+_RE_SCAN_STATE = re.compile(
+    r"(?P<ap>starting ap scan)"
+    r"|(?P<bluetooth>starting (?:bluetooth|ble|bt) scan)"
+    r"|(?P<station>starting (?:station|sta) scan)"
+    r"|(?P<stopped>shutting down ble|stopping wifi|stopscan)",
+    re.ASCII,
 )
+_SCAN_EVENTS: dict[str, Event] = {
+    "ap": ScanStarted(scan_type="ap"),
+    "bluetooth": ScanStarted(scan_type="bluetooth"),
+    "station": ScanStarted(scan_type="station"),
+    "stopped": ScanStopped(),
+}
 
-# Station scan line:  -55 Station: AA:BB:CC:DD:EE:FF Associated: 11:22:33:44:55:66
-_RE_STATION = re.compile(
-    r"^(-?\d+)\s+Station:\s*([0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5})"
-    r"\s+Associated:\s*([0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5})\s*$"
-)
+# Raw MAC text -> canonical upper-case string, so repeated sightings of a
+# device share one object (and skip ``.upper()``).  Oldest entries are
+# evicted first once the table is full.
+_MAC_CACHE_MAX: int = 4096
+_mac_cache: dict[str, str] = {}
 
-# BLE device with name:  -80 Device: [LG] webOS TV UP7550PSF
-# BLE device without name:  -73 Device: 63:C6:BB:7B:D1:1C
-_RE_BLE_NAMED = re.compile(
-    r"^(-?\d+)\s+Device:\s*\[(.+?)\]\s*(.*?)\s*$"
-)
-_RE_BLE_MAC = re.compile(
-    r"^(-?\d+)\s+Device:\s*([0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5})\s*$"
-)
 
-# Scan started indicators
-_RE_SCAN_STARTED_AP = re.compile(r"Starting AP scan", re.IGNORECASE)
-_RE_SCAN_STARTED_BT = re.compile(r"Starting (Bluetooth|BLE|BT) scan", re.IGNORECASE)
-_RE_SCAN_STARTED_STA = re.compile(r"Starting (Station|STA) scan", re.IGNORECASE)
+def _intern_mac(raw: str) -> str:
+    mac = _mac_cache.get(raw)
+    if mac is None:
+        if len(_mac_cache) >= _MAC_CACHE_MAX:
+            del _mac_cache[next(iter(_mac_cache))]
+        mac = _mac_cache[raw] = sys.intern(raw.upper())
+    return mac
 
-# Beacon info lines (ignored)
-_RE_BEACON = re.compile(r"^Beacon:", re.IGNORECASE)
 
-# Scan stopped indicators
-_RE_SCAN_STOPPED = re.compile(
-    r"(Shutting down BLE|Stopping WiFi|stopscan)", re.IGNORECASE
-)
+def _ap_event(m: re.Match[str]) -> APFound:
+    return APFound(
+        rssi=int(m["ap_rssi"]),
+        channel=int(m["ap_ch"]),
+        bssid=_intern_mac(m["ap_bssid"]),
+        ssid=m["ap_ssid"],
+    )
+
+
+def _station_event(m: re.Match[str]) -> StationFound:
+    return StationFound(
+        rssi=int(m["sta_rssi"]),
+        mac=_intern_mac(m["sta_mac"]),
+        associated_bssid=_intern_mac(m["sta_bssid"]),
+    )
+
+
+def _ble_named_event(m: re.Match[str]) -> BLEDeviceFound:
+    # Both groups come out of the regex already trimmed
+    brand, model = m["bn_brand"], m["bn_model"]
+    name = f"[{brand}] {model}" if model else f"[{brand}]"
+    return BLEDeviceFound(rssi=int(m["bn_rssi"]), name=name, mac="")
+
+
+def _ble_mac_event(m: re.Match[str]) -> BLEDeviceFound:
+    return BLEDeviceFound(rssi=int(m["bm_rssi"]), name="", mac=_intern_mac(m["bm_mac"]))
+
+
+# ``_RE_LINE`` group name -> event builder.
+_LINE_EVENTS: dict[str, Callable[[re.Match[str]], Event]] = {
+    "ap": _ap_event,
+    "sta": _station_event,
+    "ble_named": _ble_named_event,
+    "ble_mac": _ble_mac_event,
+}
 
 # ---------------------------------------------------------------------------
 # Default port detection
@@ -132,10 +222,30 @@ _RE_SCAN_STOPPED = re.compile(
 
 _MACOS_SERIAL_GLOB = "/dev/cu.usbserial-*"
 
+# USB (VID, PID) of the serial bridges found on ESP32 boards.
+_KNOWN_USB_IDS: frozenset[tuple[int, int]] = frozenset({
+    (0x10C4, 0xEA60),  # Silicon Labs CP210x
+    (0x1A86, 0x7523),  # WCH CH340
+    (0x1A86, 0x55D4),  # WCH CH9102
+    (0x0403, 0x6001),  # FTDI FT232R
+    (0x303A, 0x1001),  # Espressif native USB-Serial/JTAG
+})
+
+# Upper bound for the exponential reconnect backoff, in seconds.
+_RECONNECT_MAX_DELAY: float = 30.0
+
 
 def _auto_detect_port() -> str | None:
-    """Return the first matching macOS USB-serial port, or ``None``."""
-    ports = sorted(glob.glob(_MACOS_SERIAL_GLOB))
+    """Return the first port of a known ESP32 USB-serial bridge, or ``None``.
+
+    Falls back to the macOS ``usbserial`` device glob when no enumerated
+    port has a known VID:PID.
+    """
+    ports = sorted(
+        p.device for p in list_ports.comports() if (p.vid, p.pid) in _KNOWN_USB_IDS
+    )
+    if not ports:
+        ports = sorted(glob.glob(_MACOS_SERIAL_GLOB))
     if ports:
         logger.info("Auto-detected serial port: %s", ports[0])
         return ports[0]
@@ -155,16 +265,18 @@ class SerialBridge:
     baudrate:
         Serial baud rate. Marauder defaults to 115200.
     reconnect_delay:
-        Seconds to wait before attempting reconnection after disconnect.
+        Seconds to wait before the first reconnection attempt after a
+        disconnect.  Doubles after each failed attempt, up to 30 s.
     raw_history_size:
-        Maximum number of raw lines to keep in the history deque.
+        Number of raw lines to keep in :attr:`raw_lines`.  ``0`` (the
+        default) disables the history.
     """
 
     def __init__(
         self,
         baudrate: int = 115200,
         reconnect_delay: float = 3.0,
-        raw_history_size: int = 500,
+        raw_history_size: int = 0,
     ) -> None:
         self._baudrate: int = baudrate
         self._reconnect_delay: float = reconnect_delay
@@ -172,14 +284,26 @@ class SerialBridge:
         self._port: str | None = None
         self._serial: serial.Serial | None = None
         self._running: bool = False
+        # Set by disconnect() to cut a reconnect backoff wait short.
+        self._stop_event: threading.Event = threading.Event()
+        # Line pattern ordered for the scan the device last reported
+        self._line_re: re.Pattern[str] = _RE_LINE
         self._reader_thread: threading.Thread | None = None
+        self._writer_thread: threading.Thread | None = None
 
-        self._callbacks: list[Callable[[Event], None]] = []
+        # Copy-on-write: rebound under the lock, read lock-free by _emit.
+        self._callbacks: tuple[Callable[[Event], None], ...] = ()
         self._callbacks_lock: threading.Lock = threading.Lock()
 
-        self._write_lock: threading.Lock = threading.Lock()
+        # Encoded commands for the writer thread; ``None`` stops it.
+        self._tx_queue: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
 
-        self.raw_lines: deque[str] = deque(maxlen=raw_history_size)
+        # Preallocated ring; ``_raw_count`` only grows, so the write slot
+        # is ``_raw_count % len(_raw)``.
+        self._raw: list[str | None] | None = (
+            [None] * raw_history_size if raw_history_size > 0 else None
+        )
+        self._raw_count: int = 0
 
     # -- public API ---------------------------------------------------------
 
@@ -188,18 +312,35 @@ class SerialBridge:
         """The currently configured serial port path."""
         return self._port
 
+    @property
+    def raw_lines(self) -> list[str]:
+        """Snapshot of the raw line history, oldest first.
+
+        Empty unless the bridge was created with ``raw_history_size > 0``.
+        """
+        raw = self._raw
+        if raw is None:
+            return []
+        count = self._raw_count
+        if count < len(raw):
+            return raw[:count]
+        pos = count % len(raw)
+        return raw[pos:] + raw[:pos]
+
     def on_event(self, callback: Callable[[Event], None]) -> None:
         """Register a *callback* that will receive every parsed event."""
         with self._callbacks_lock:
-            self._callbacks.append(callback)
+            self._callbacks = self._callbacks + (callback,)
 
     def remove_event(self, callback: Callable[[Event], None]) -> None:
         """Remove a previously registered callback."""
         with self._callbacks_lock:
+            callbacks = list(self._callbacks)
             try:
-                self._callbacks.remove(callback)
+                callbacks.remove(callback)
             except ValueError:
-                pass
+                return
+            self._callbacks = tuple(callbacks)
 
     def connect(self, port: str | None = None) -> None:
         """Open the serial port and start the reader thread.
@@ -224,7 +365,7 @@ class SerialBridge:
         if resolved_port is None:
             raise RuntimeError(
                 "No serial port specified and auto-detection found nothing. "
-                f"Looked for: {_MACOS_SERIAL_GLOB}"
+                f"Looked for known ESP32 USB-serial bridges and {_MACOS_SERIAL_GLOB}"
             )
 
         self._port = resolved_port
@@ -244,17 +385,33 @@ class SerialBridge:
         self._serial.dtr = False
 
         self._running = True
+        self._stop_event.clear()
         self._reader_thread = threading.Thread(
             target=self._reader_loop,
             name="marauder-serial-reader",
             daemon=True,
         )
         self._reader_thread.start()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="marauder-serial-writer",
+            daemon=True,
+        )
+        self._writer_thread.start()
 
     def disconnect(self) -> None:
-        """Stop the reader thread and close the serial port."""
+        """Stop the reader and writer threads and close the serial port.
+
+        Commands already queued by :meth:`send_command` are written first.
+        """
         self._running = False
+        self._stop_event.set()
+        if self._writer_thread is not None:
+            self._tx_queue.put(None)
+            self._writer_thread.join(timeout=5.0)
+            self._writer_thread = None
         if self._reader_thread is not None:
+            self._cancel_read()
             self._reader_thread.join(timeout=5.0)
             self._reader_thread = None
         self._close_serial()
@@ -267,33 +424,40 @@ class SerialBridge:
     def send_command(self, cmd: str) -> None:
         """Send a command string to the Marauder device.
 
-        A newline is appended automatically. Thread-safe.
+        A newline is appended automatically. Thread-safe. The command is
+        queued for the writer thread, so this never blocks on the port.
 
         Raises
         ------
         RuntimeError
             If the bridge is not connected.
         """
-        with self._write_lock:
-            if self._serial is None or not self._serial.is_open:
-                raise RuntimeError("Serial port is not open.")
-            payload = cmd if cmd.endswith("\n") else cmd + "\n"
-            self._serial.write(payload.encode("utf-8", errors="replace"))
-            self._serial.flush()
-            logger.debug("TX >>> %s", cmd)
+        if self._serial is None or not self._serial.is_open:
+            raise RuntimeError("Serial port is not open.")
+        payload = cmd if cmd.endswith("\n") else cmd + "\n"
+        self._tx_queue.put(payload.encode("utf-8", errors="replace"))
+        logger.debug("TX >>> %s", cmd)
 
     # -- internal -----------------------------------------------------------
 
     def _emit(self, event: Event) -> None:
         """Dispatch *event* to all registered callbacks."""
-        with self._callbacks_lock:
-            callbacks = list(self._callbacks)
-        for cb in callbacks:
+        for cb in self._callbacks:
             try:
                 cb(event)
             except Exception:
                 logger.exception("Exception in event callback %r", cb)
 
+    def _cancel_read(self) -> None:
+        """Wake a reader blocked in ``read()`` instead of waiting out the timeout."""
+        cancel = getattr(self._serial, "cancel_read", None)
+        if cancel is None:
+            return
+        try:
+            cancel()
+        except (serial.SerialException, OSError):
+            pass
+
     def _close_serial(self) -> None:
         if self._serial is not None:
             try:
@@ -303,36 +467,74 @@ class SerialBridge:
             self._serial = None
 
     def _reader_loop(self) -> None:
-        """Background loop that reads lines and dispatches events."""
+        """Background loop that reads lines and dispatches events.
+
+        ``Serial.readline()`` issues one ``read(1)`` syscall per byte, so
+        instead each read takes whatever is waiting (blocking up to the
+        port timeout for at least one byte).  Everything up to the last
+        newline is decoded at once and split into lines; the incomplete
+        tail stays in the buffer for the next read.
+        """
+        buffer = bytearray()
         while self._running:
             try:
                 if self._serial is None or not self._serial.is_open:
                     raise serial.SerialException("Port closed")
 
-                raw_line: bytes = self._serial.readline()
-                if not raw_line:
+                chunk: bytes = self._serial.read(self._serial.in_waiting or 1)
+                if not chunk:
                     continue
+                buffer += chunk
 
-                line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
-                self._handle_line(line)
+                end = buffer.rfind(b"\n")
+                if end < 0:
+                    continue
+                completed = buffer[: end + 1].decode("utf-8", errors="replace")
+                del buffer[: end + 1]
+                for line in completed.splitlines():
+                    if not self._running:
+                        break
+                    self._handle_line(line)
 
             except (serial.SerialException, OSError) as exc:
                 if not self._running:
                     break
                 logger.warning("Serial error: %s", exc)
+                buffer.clear()
                 self._close_serial()
                 self._emit(Disconnected(reason=str(exc)))
                 self._attempt_reconnect()
 
+    def _writer_loop(self) -> None:
+        """Background loop that writes queued commands to the port in order."""
+        while True:
+            data = self._tx_queue.get()
+            if data is None:
+                return
+            port = self._serial
+            if port is None or not port.is_open:
+                logger.warning("Serial port closed, dropping command %r", data)
+                continue
+            try:
+                port.write(data)
+            except (serial.SerialException, OSError) as exc:
+                # The reader notices the dead port and handles reconnection
+                logger.warning("Serial write failed: %s", exc)
+
     def _attempt_reconnect(self) -> None:
-        """Try to reopen the same port until success or shutdown."""
+        """Try to reopen the same port until success or shutdown.
+
+        The wait between attempts starts at ``reconnect_delay`` and doubles
+        after every failure, capped at ``_RECONNECT_MAX_DELAY``.
+        """
+        delay = self._reconnect_delay
         while self._running:
-            time.sleep(self._reconnect_delay)
-            if not self._running:
+            if self._stop_event.wait(delay) or not self._running:
                 return
+            delay = min(delay * 2, _RECONNECT_MAX_DELAY)
             port = self._port or _auto_detect_port()
             if port is None:
-                logger.debug("Reconnect: no port found, retrying...")
+                logger.debug("Reconnect: no port found, retrying in %.0fs", delay)
                 continue
             try:
                 logger.info("Reconnecting to %s ...", port)
@@ -340,6 +542,7 @@ class SerialBridge:
                     port=port,
                     baudrate=self._baudrate,
                     timeout=1.0,
+                    write_timeout=2.0,
                 )
                 self._port = port
                 logger.info("Reconnected to %s", port)
@@ -349,85 +552,42 @@ class SerialBridge:
 
     def _handle_line(self, line: str) -> None:
         """Parse a single line and emit the corresponding event."""
-        self.raw_lines.append(line)
+        raw = self._raw
+        if raw is not None:
+            raw[self._raw_count % len(raw)] = line
+            self._raw_count += 1
 
-        if not line.strip():
+        if not line or line.isspace():
             return
 
         # Strip leading "> " prompt that Marauder sometimes prepends
         stripped = line.lstrip("> ").strip()
 
-        # --- Beacon info line (ignored) ---
-        if _RE_BEACON.match(stripped):
-            return
-
-        # --- AP scan line ---
-        m = _RE_AP.match(stripped)
-        if m:
-            self._emit(
-                APFound(
-                    rssi=int(m.group(1)),
-                    channel=int(m.group(2)),
-                    bssid=m.group(3).upper(),
-                    ssid=m.group(4),
-                )
-            )
-            return
-
-        # --- Station scan line ---
-        m = _RE_STATION.match(stripped)
-        if m:
-            self._emit(
-                StationFound(
-                    rssi=int(m.group(1)),
-                    mac=m.group(2).upper(),
-                    associated_bssid=m.group(3).upper(),
-                )
-            )
-            return
+        # --- AP / station / BLE lines (one full-line match) ---
+        first = stripped[:1]
+        if first in _RSSI_START_CHARS:
+            m = self._line_re.fullmatch(stripped)
+            if m:
+                self._emit(_LINE_EVENTS[m.lastgroup](m))
+                return
 
-        # --- BLE device (named) ---
-        m = _RE_BLE_NAMED.match(stripped)
-        if m:
-            brand = m.group(2).strip()
-            model = m.group(3).strip()
-            name = f"[{brand}] {model}" if model else f"[{brand}]"
-            self._emit(
-                BLEDeviceFound(
-                    rssi=int(m.group(1)),
-                    name=name,
-                    mac="",
-                )
-            )
+        # --- Beacon info line (ignored) ---
+        if first in ("b", "B") and stripped[:7].lower() == "beacon:":
             return
 
-        # --- BLE device (MAC only) ---
-        m = _RE_BLE_MAC.match(stripped)
-        if m:
-            self._emit(
-                BLEDeviceFound(
-                    rssi=int(m.group(1)),
-                    name="",
-                    mac=m.group(2).upper(),
+        # --- Scan started / stopped ---
+        lowered = stripped.lower()
+        if "scan" in lowered or "shutting" in lowered or "stopping" in lowered:
+            m = _RE_SCAN_STATE.search(lowered)
+            if m:
+                event = _SCAN_EVENTS[m.lastgroup]
+                self._line_re = (
+                    _RE_LINE_BY_SCAN.get(event.scan_type, _RE_LINE)
+                    if isinstance(event, ScanStarted)
+                    else _RE_LINE
                 )
-            )
-            return
-
-        # --- Scan started ---
-        if _RE_SCAN_STARTED_AP.search(stripped):
-            self._emit(ScanStarted(scan_type="ap"))
-            return
-        if _RE_SCAN_STARTED_BT.search(stripped):
-            self._emit(ScanStarted(scan_type="bluetooth"))
-            return
-        if _RE_SCAN_STARTED_STA.search(stripped):
-            self._emit(ScanStarted(scan_type="station"))
-            return
-
-        # --- Scan stopped ---
-        if _RE_SCAN_STOPPED.search(stripped):
-            self._emit(ScanStopped())
-            return
+                self._emit(event)
+                return
 
         # --- Fallback ---
         self._emit(RawLine(text=line))
@@ -1,11 +1,13 @@
 """Scrolling activity-feed log widget with timestamped, color-coded entries."""
 from __future__ import annotations
 
-from datetime import datetime
+from functools import lru_cache
 
 from rich.text import Text
 from textual.widgets import RichLog
 
+from marauder.clock import hhmmss
+
 
 # ---------------------------------------------------------------------------
 # Category -> color mapping
@@ -24,6 +26,22 @@ _DEFAULT_STYLE: str = "bold #00ff00"
 _MAX_LINES: int = 200
 
 
+@lru_cache(maxsize=32)
+def _category_prefix(category: str) -> Text:
+    """Return the styled ``" [category] "`` fragment for *category*.
+
+    Built once per category; callers copy it with ``Text.append_text``
+    and must not modify it.
+    """
+    return Text.assemble(
+        " ",
+        ("[", "dim white"),
+        (category, _CATEGORY_STYLES.get(category, _DEFAULT_STYLE)),
+        ("]", "dim white"),
+        " ",
+    )
+
+
 class ActivityFeed(RichLog):
     """Real-time scrolling event log with hacker-terminal aesthetics.
 
@@ -82,17 +100,9 @@ class ActivityFeed(RichLog):
         message:
             Free-form message text displayed after the category tag.
         """
-        now: str = datetime.now().strftime("%H:%M:%S")
-        cat_style: str = _CATEGORY_STYLES.get(category, _DEFAULT_STYLE)
-
-        line = Text.assemble(
-            (now, "dim #00aa00"),
-            " ",
-            ("[", "dim white"),
-            (category, cat_style),
-            ("]", "dim white"),
-            " ",
-            (message, "#00ff00"),
-        )
+        line = Text()
+        line.append(hhmmss(), "dim #00aa00")
+        line.append_text(_category_prefix(category))
+        line.append(message, "#00ff00")
 
         self.write(line)
@@ -1,10 +1,12 @@
 """Styled DataTable subclasses for WiFi AP and BLE device listings."""
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any, Sequence
 
 from rich.text import Text
 from textual.widgets import DataTable
+from textual.widgets.data_table import ColumnKey
 
 
 # ---------------------------------------------------------------------------
@@ -25,17 +27,130 @@ def _rssi_color(rssi: int) -> str:
     return "red"
 
 
-def _styled_rssi(rssi: int) -> Text:
-    """Return a Rich Text object for an RSSI value with color coding."""
+def _build_styled_rssi(rssi: int) -> Text:
     color: str = _rssi_color(rssi)
     return Text(f"{rssi} dBm", style=f"bold {color}")
 
 
+# Prebuilt cells for every RSSI a radio can report (int8 dBm, -128..0).
+# DataTable renders Text cells without modifying them, so rows share these.
+_RSSI_TEXT: dict[int, Text] = {rssi: _build_styled_rssi(rssi) for rssi in range(-128, 1)}
+
+
+def _styled_rssi(rssi: int) -> Text:
+    """Return a Rich Text object for an RSSI value with color coding."""
+    text = _RSSI_TEXT.get(rssi)
+    return text if text is not None else _build_styled_rssi(rssi)
+
+
+def _strongest_first(rows: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    """Sort *rows* in place by RSSI (column 0) descending and return them.
+
+    Callers usually pass devices already ranked by the engine, so the sort
+    is skipped when the rows are in order.
+    """
+    if any(a[0] < b[0] for a, b in zip(rows, rows[1:])):
+        rows.sort(key=itemgetter(0), reverse=True)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Shared row sync
+# ---------------------------------------------------------------------------
+
+class _DeviceTable(DataTable):
+    """DataTable that updates its rows in place instead of rebuilding them.
+
+    Subclasses describe their columns with ``_COLUMN_STYLES`` (column 0 is
+    always the RSSI) and name the column holding the row key (BSSID / MAC)
+    with ``_KEY_COLUMN``; their ``on_mount`` stores the keys returned by
+    ``add_columns`` in ``_column_keys``.
+    """
+
+    # Index of the column whose value keys the row.
+    _KEY_COLUMN: int = 0
+
+    # Rich style of each non-RSSI column, in column order.
+    _COLUMN_STYLES: tuple[str, ...] = ()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._column_keys: list[ColumnKey] = []
+        # Row key -> raw column values currently shown
+        self._row_values: dict[str, tuple[Any, ...]] = {}
+        # False while the table holds unkeyed rows (see _sync_rows)
+        self._keyed: bool = True
+
+    def _cell(self, column: int, value: Any) -> Text:
+        if column == 0:
+            return _styled_rssi(value)
+        return Text(value, style=self._COLUMN_STYLES[column])
+
+    def _cells(self, values: tuple[Any, ...]) -> list[Text]:
+        return [self._cell(column, value) for column, value in enumerate(values)]
+
+    def _sync_rows(self, rows: Sequence[tuple[Any, ...]]) -> None:
+        """Show *rows* (raw column values, in display order).
+
+        Only rows that appeared or vanished are added or removed, and only
+        cells whose value changed are re-rendered; the table is re-sorted
+        only when the order differs.
+
+        The engine never produces two rows with the same key (it dedups
+        on BSSID / MAC), but ``update_devices`` accepts any sequence; as a
+        guard for such callers, rows sharing a key cannot be addressed
+        individually, so the table is rebuilt instead.
+        """
+        key_column = self._KEY_COLUMN
+        keys = [row[key_column] for row in rows]
+        shown = self._row_values
+
+        if len(set(keys)) != len(keys):
+            self.clear()
+            shown.clear()
+            self._keyed = False
+            for row in rows:
+                self.add_row(*self._cells(row))
+            return
+        if not self._keyed:
+            self.clear()
+            self._keyed = True
+
+        new = dict(zip(keys, rows))
+        for key in [key for key in shown if key not in new]:
+            self.remove_row(key)
+            del shown[key]
+
+        for key, row in new.items():
+            old = shown.get(key)
+            if old == row:
+                continue
+            if old is None:
+                self.add_row(*self._cells(row), key=key)
+            else:
+                for column, (before, after) in enumerate(zip(old, row)):
+                    if before != after:
+                        self.update_cell(
+                            key,
+                            self._column_keys[column],
+                            self._cell(column, after),
+                            update_width=True,
+                        )
+            shown[key] = row
+
+        if [row.key.value for row in self.ordered_rows] != keys:
+            position = {key: idx for idx, key in enumerate(keys)}
+            self.sort(
+                self._column_keys[key_column],
+                key=lambda cell: position[cell.plain],
+            )
+
+
 # ---------------------------------------------------------------------------
 # WiFiTable
 # ---------------------------------------------------------------------------
 
-class WiFiTable(DataTable):
+class WiFiTable(_DeviceTable):
     """DataTable for WiFi access-point scan results.
 
     Columns: RSSI | SSID | BSSID | Channel
@@ -79,46 +194,43 @@ class WiFiTable(DataTable):
     }
     """
 
+    _KEY_COLUMN = 2
+    _COLUMN_STYLES = ("", "bold #00ff00", "#00cc00", "#00cc00")
+
     def on_mount(self) -> None:
         """Set up columns when the widget is mounted."""
         self.cursor_type = "row"
         self.zebra_stripes = True
-        self.add_columns("RSSI", "SSID", "BSSID", "Channel")
+        self._column_keys = self.add_columns("RSSI", "SSID", "BSSID", "Channel")
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def update_devices(self, devices: Sequence[Any]) -> None:
-        """Clear the table and repopulate from *devices*.
+        """Show *devices*, updating only the rows and cells that changed.
 
         Each element is expected to have ``.rssi`` (int), ``.ssid`` (str),
         ``.bssid`` (str), and ``.channel`` (int) attributes.  Rows are
-        sorted by RSSI descending (strongest signal first).
+        keyed by BSSID and sorted by RSSI descending (strongest signal
+        first).
         """
-        self.clear()
-
-        # Sort strongest signal first.
-        sorted_devices = sorted(devices, key=lambda d: d.rssi, reverse=True)
-
-        for dev in sorted_devices:
-            rssi: int = int(dev.rssi)
-            ssid: str = str(getattr(dev, "ssid", ""))
-            bssid: str = str(getattr(dev, "bssid", ""))
-            channel: str = str(getattr(dev, "channel", ""))
-            self.add_row(
-                _styled_rssi(rssi),
-                Text(ssid, style="bold #00ff00"),
-                Text(bssid, style="#00cc00"),
-                Text(channel, style="#00cc00"),
+        self._sync_rows(_strongest_first([
+            (
+                int(dev.rssi),
+                str(getattr(dev, "ssid", "")),
+                str(getattr(dev, "bssid", "")),
+                str(getattr(dev, "channel", "")),
             )
+            for dev in devices
+        ]))
 
 
 # ---------------------------------------------------------------------------
 # BLETable
 # ---------------------------------------------------------------------------
 
-class BLETable(DataTable):
+class BLETable(_DeviceTable):
     """DataTable for BLE device scan results.
 
     Columns: RSSI | Name | MAC Address
@@ -161,33 +273,31 @@ class BLETable(DataTable):
     }
     """
 
+    _KEY_COLUMN = 2
+    _COLUMN_STYLES = ("", "bold #00ccff", "#00aacc")
+
     def on_mount(self) -> None:
         """Set up columns when the widget is mounted."""
         self.cursor_type = "row"
         self.zebra_stripes = True
-        self.add_columns("RSSI", "Name", "MAC Address")
+        self._column_keys = self.add_columns("RSSI", "Name", "MAC Address")
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def update_devices(self, devices: Sequence[Any]) -> None:
-        """Clear the table and repopulate from *devices*.
+        """Show *devices*, updating only the rows and cells that changed.
 
         Each element is expected to have ``.rssi`` (int), ``.name`` (str),
-        and ``.mac`` (str) attributes.  Rows are sorted by RSSI descending
-        (strongest signal first).
+        and ``.mac`` (str) attributes.  Rows are keyed by MAC and sorted
+        by RSSI descending (strongest signal first).
         """
-        self.clear()
-
-        sorted_devices = sorted(devices, key=lambda d: d.rssi, reverse=True)
-
-        for dev in sorted_devices:
-            rssi: int = int(dev.rssi)
-            name: str = str(getattr(dev, "name", "Unknown"))
-            mac: str = str(getattr(dev, "mac", ""))
-            self.add_row(
-                _styled_rssi(rssi),
-                Text(name, style="bold #00ccff"),
-                Text(mac, style="#00aacc"),
+        self._sync_rows(_strongest_first([
+            (
+                int(dev.rssi),
+                str(getattr(dev, "name", "Unknown")),
+                str(getattr(dev, "mac", "")),
             )
+            for dev in devices
+        ]))
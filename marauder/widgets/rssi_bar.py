@@ -1,6 +1,8 @@
 """RSSI signal strength bar widget with hacker-aesthetic color coding."""
 from __future__ import annotations
 
+from functools import lru_cache
+
 from rich.text import Text
 from textual.widget import Widget
 from textual.reactive import reactive
@@ -13,6 +15,9 @@ _BLOCKS: list[str] = ["█", "▉", "▊", "▋", "▌", "▍", "▎", "▏"]
 _RSSI_MIN: int = -100
 _RSSI_MAX: int = -30
 
+# Runs of full blocks for every bar length up to a typical terminal width.
+_FULL_BLOCK_RUNS: list[str] = ["█" * n for n in range(256)]
+
 
 def _rssi_color(rssi: int) -> str:
     """Return a Rich color name based on signal strength.
@@ -28,8 +33,9 @@ def _rssi_color(rssi: int) -> str:
     return "red"
 
 
-def _build_bar(rssi: int, width: int) -> Text:
-    """Build a Rich Text bar representing *rssi* in *width* character cells.
+@lru_cache(maxsize=512)
+def _bar_chars(rssi: int, width: int) -> str:
+    """Return the *width*-cell bar glyphs for *rssi* (memoized per pair).
 
     The bar maps the RSSI range [_RSSI_MIN .. _RSSI_MAX] onto [0 .. width]
     using full-block and fractional-block Unicode characters for smooth
@@ -46,26 +52,46 @@ def _build_bar(rssi: int, width: int) -> Text:
     full_blocks: int = int(bar_float)
     remainder: float = bar_float - full_blocks
 
-    color: str = _rssi_color(rssi)
-
     # Build the visible bar string.
-    bar_chars: str = "█" * full_blocks
+    if full_blocks < len(_FULL_BLOCK_RUNS):
+        bar_chars: str = _FULL_BLOCK_RUNS[full_blocks]
+    else:
+        bar_chars = "█" * full_blocks
 
     # Add a fractional block if there is leftover space.
     if remainder > 0 and full_blocks < width:
         # Map the remainder [0..1) to one of the 8 partial-block glyphs.
         idx: int = max(0, min(len(_BLOCKS) - 1, int((1.0 - remainder) * len(_BLOCKS))))
         bar_chars += _BLOCKS[idx]
-        full_blocks += 1
 
     # Pad the rest with spaces so the widget occupies exactly *width* cells.
-    bar_chars += " " * (width - full_blocks)
+    return bar_chars.ljust(width)
+
 
+def _build_bar(rssi: int, width: int) -> Text:
+    """Build a Rich Text bar representing *rssi* in *width* character cells."""
+    color: str = _rssi_color(rssi)
     return Text.assemble(
-        (bar_chars, f"bold {color}"),
+        (_bar_chars(rssi, width), f"bold {color}"),
     )
 
 
+@lru_cache(maxsize=1024)
+def _render_bar(rssi: int, width: int) -> Text:
+    """Return the bar plus dBm label filling *width* cells (memoized).
+
+    The result is shared between calls and widgets; callers must not
+    modify it.  Textual converts it to ``Content`` without mutating it.
+    """
+    # Reserve space for the label, e.g. " -42dBm" (7-8 chars).
+    label: str = f" {rssi}dBm"
+    bar_width: int = max(1, width - len(label))
+    bar: Text = _build_bar(rssi, bar_width)
+    color: str = _rssi_color(rssi)
+    bar.append(label, style=f"bold {color}")
+    return bar
+
+
 class RSSIBar(Widget):
     """Horizontal RSSI signal-strength bar.
 
@@ -101,13 +127,7 @@ class RSSIBar(Widget):
 
     def render(self) -> Text:
         """Render the bar + dBm label into the available width."""
-        # Reserve space for the label, e.g. " -42dBm" (7-8 chars).
-        label: str = f" {self.rssi}dBm"
-        bar_width: int = max(1, self.size.width - len(label))
-        bar: Text = _build_bar(self.rssi, bar_width)
-        color: str = _rssi_color(self.rssi)
-        bar.append(label, style=f"bold {color}")
-        return bar
+        return _render_bar(self.rssi, self.size.width)
 
     # ------------------------------------------------------------------
     # Reactive watchers